@@ -0,0 +1,23 @@
+import disnake
+from fastapi import APIRouter, HTTPException
+
+from backend.middlewares.uniform_response import uniform_response_middleware
+from backend.schemas import Bootstrap
+from backend.services.format import format_guild_tree_response
+from backend.services.server_config import server_config
+
+router = APIRouter()
+
+
+@router.get("/bootstrap", response_model=Bootstrap)
+@uniform_response_middleware
+async def get_bootstrap():
+    try:
+        return Bootstrap(
+            guild=await format_guild_tree_response(),
+            config=await server_config.get_validated_config(),
+        )
+    except disnake.errors.HTTPException as exception:
+        raise HTTPException(status_code=exception.status, detail=str(exception.text))
+    except Exception as exception:
+        raise HTTPException(status_code=500, detail=str(exception))
@@ -1,10 +1,17 @@
 import disnake
-from disnake import PermissionOverwrite
 from fastapi import APIRouter, HTTPException, Body
 
 from backend.middlewares.uniform_response import uniform_response_middleware
-from backend.schemas import Category, Role, NameRequestBody, PositionRequestBody
+from backend.schemas import (
+    Category,
+    CategoryAccessMatrix,
+    Role,
+    NameRequestBody,
+    PositionRequestBody,
+    ResponseWrapper
+)
 from backend.services.fetch import (
+    fetch_categories,
     fetch_channel,
     fetch_channels_by_type,
     fetch_roles_with_access,
@@ -13,9 +20,12 @@ from backend.services.fetch import (
 from backend.services.format import (
     format_categories_response,
     format_base_channel_response,
+    format_category_access_matrix_response,
     format_roles_with_access_response,
     format_roles_response
 )
+from backend.services.permission_sync import apply_permission_plans, plan_category_access
+from backend.services.response_cache import response_cache, ResponseCacheService
 from backend.utils.categories import delete_target_category, create_template_category
 from backend.utils.channels import rename_target_channel
 from backend.utils.reorder_request import update_channel_order
@@ -46,7 +56,7 @@ async def rename_category(category_id: int, request_body: NameRequestBody = Body
             raise ValueError("Name cannot be the same")
 
         await rename_target_channel(channel, request_body.name)
-        return await format_categories_response()
+        return await format_categories_response(force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except ValueError as exception:
@@ -61,7 +71,7 @@ async def create_category(request_body: NameRequestBody = Body(...)):
     try:
         name = request_body.name
         await create_template_category(name)
-        return await format_categories_response()
+        return await format_categories_response(force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except ValueError as exception:
@@ -78,7 +88,7 @@ async def reorder_category_position(category_id: int, request_body: PositionRequ
         if channel.type != disnake.ChannelType.category:
             raise ValueError("Incorrect channel type")
 
-        channels = await fetch_channels_by_type(channel.type)
+        channels = await fetch_channels_by_type(channel.type, force_refresh=True)
         channels.sort(key=lambda c: (c.position, c.id))
 
         channels.remove(channel)
@@ -91,7 +101,7 @@ async def reorder_category_position(category_id: int, request_body: PositionRequ
 
         await update_channel_order(payload)
 
-        return await format_categories_response()
+        return await format_categories_response(force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except ValueError as exception:
@@ -109,7 +119,70 @@ async def delete_category(category_id: int):
             raise ValueError("Incorrect channel type")
 
         await delete_target_category(channel)
-        return await format_categories_response()
+        return await format_categories_response(force_refresh=True)
+    except disnake.errors.HTTPException as exception:
+        raise HTTPException(status_code=exception.status, detail=str(exception.text))
+    except ValueError as exception:
+        raise HTTPException(status_code=400, detail=str(exception))
+    except Exception as exception:
+        raise HTTPException(status_code=500, detail=str(exception))
+
+
+@router.get("/categories/permissions", response_model=CategoryAccessMatrix)
+@uniform_response_middleware
+async def get_category_access_matrix():
+    try:
+        return await format_category_access_matrix_response()
+    except disnake.errors.HTTPException as exception:
+        raise HTTPException(status_code=exception.status, detail=str(exception.text))
+    except Exception as exception:
+        raise HTTPException(status_code=500, detail=str(exception))
+
+
+@router.put("/categories/permissions", response_model=CategoryAccessMatrix)
+@uniform_response_middleware
+async def edit_category_access_matrix(request_body: CategoryAccessMatrix = Body(...)):
+    try:
+        if len(request_body.matrix) != len(request_body.role_ids) or any(
+            len(row) != len(request_body.category_ids) for row in request_body.matrix
+        ):
+            raise ValueError("Matrix dimensions do not match role and category ids")
+
+        roles_result = await fetch_roles_by_ids(request_body.role_ids)
+        roles = {str(role.id): role for role in roles_result.found}
+        categories = {str(category.id): category for category in await fetch_categories()}
+        everyone_role = await fetch_guild_default_role()
+        errors = dict(roles_result.errors)
+
+        plans = []
+        for column, category_id in enumerate(request_body.category_ids):
+            category = categories.get(category_id)
+            if category is None:
+                errors[category_id] = "Category not found"
+                continue
+
+            target_access = {role.id: role for role in await fetch_roles_with_access(category)}
+            for role_id, row in zip(request_body.role_ids, request_body.matrix):
+                role = roles.get(role_id)
+                if role is None:
+                    continue
+                if row[column]:
+                    target_access[role.id] = role
+                else:
+                    target_access.pop(role.id, None)
+
+            plans.append(plan_category_access(category, everyone_role, target_access.values()))
+
+        sync_result = await apply_permission_plans(plans)
+        await response_cache.invalidate(ResponseCacheService.CHANNELS)
+
+        meta = sync_result.as_meta()
+        meta["errors"].update(errors)
+        return ResponseWrapper(
+            data=await format_category_access_matrix_response(force_refresh=True),
+            success=True,
+            meta=meta
+        )
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except ValueError as exception:
@@ -143,34 +216,24 @@ async def edit_category_permissions(category_id: int, roles_with_access: list[st
         if not isinstance(category, disnake.CategoryChannel):
             raise ValueError("Incorrect channel type, expected category")
 
-        try:
-            fetched_roles_with_access = await fetch_roles_by_ids(roles_with_access)
-        except disnake.errors.HTTPException:
-            raise ValueError("Incorrect object in roles")
-
-        actual_roles_with_access = fetch_roles_with_access(category)
-
+        roles_result = await fetch_roles_by_ids(roles_with_access)
+        fetched_roles_with_access = roles_result.found
         everyone_role = await fetch_guild_default_role()
 
-        permissions_overwrites_to_remove = {}
-        permissions_overwrites_to_add = {
-            everyone_role: PermissionOverwrite(
-                view_channel=False,
-                create_instant_invite=False,
-                read_message_history=True,
-            ),
-        }
-
-        for role in await actual_roles_with_access:
-            if role not in fetched_roles_with_access:
-                permissions_overwrites_to_remove[role] = PermissionOverwrite()
-        await category.edit(overwrites=permissions_overwrites_to_remove)
-
-        for role in fetched_roles_with_access:
-            permissions_overwrites_to_add[role] = PermissionOverwrite(view_channel=True)
-        await category.edit(overwrites=permissions_overwrites_to_add)
-
-        return await format_roles_response(fetched_roles_with_access)
+        sync_result = await apply_permission_plans([
+            plan_category_access(category, everyone_role, fetched_roles_with_access)
+        ])
+        if category.id in sync_result.failures:
+            raise sync_result.failures[category.id]
+        await response_cache.invalidate(ResponseCacheService.CHANNELS)
+
+        meta = sync_result.as_meta()
+        meta["errors"].update(roles_result.errors)
+        return ResponseWrapper(
+            data=await format_roles_response(fetched_roles_with_access),
+            success=True,
+            meta=meta
+        )
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except ValueError as exception:
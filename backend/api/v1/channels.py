@@ -63,7 +63,7 @@ async def rename_channel(channel_id: int, request_body: NameRequestBody = Body(.
 
         await rename_target_channel(channel, request_body.name)
         category = await fetch_channel(channel.category_id)
-        return await format_channels_by_category_response(category)
+        return await format_channels_by_category_response(category, force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except ValueError as exception:
@@ -82,7 +82,7 @@ async def reorder_channel_position(channel_id: int, request_body: PositionReques
 
         category = await fetch_channel(channel.category_id)
 
-        channels = await fetch_channels_by_type(channel.type)
+        channels = await fetch_channels_by_type(channel.type, force_refresh=True)
         channels.sort(key=lambda c: (c.position, c.id))
 
         channels.remove(channel)
@@ -95,7 +95,7 @@ async def reorder_channel_position(channel_id: int, request_body: PositionReques
         ]
         await update_channel_order(payload)
 
-        return await format_channels_by_category_response(category)
+        return await format_channels_by_category_response(category, force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except ValueError as exception:
@@ -113,7 +113,7 @@ async def create_text_channel(category_id: int, request_body: NameRequestBody =
             raise ValueError("Incorrect channel type")
 
         await create_text_target_channel(channel, request_body.name)
-        return await format_channels_by_category_response(channel)
+        return await format_channels_by_category_response(channel, force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except ValueError as exception:
@@ -131,7 +131,7 @@ async def create_voice_channel(category_id: int, request_body: NameRequestBody =
             raise ValueError("Incorrect channel type")
 
         await create_voice_target_channel(channel, request_body.name)
-        return await format_channels_by_category_response(channel)
+        return await format_channels_by_category_response(channel, force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except ValueError as exception:
@@ -150,7 +150,7 @@ async def delete_channel(channel_id: int):
 
         await delete_target_channel(channel)
         category = await fetch_channel(channel.category_id)
-        return await format_channels_by_category_response(category)
+        return await format_channels_by_category_response(category, force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except ValueError as exception:
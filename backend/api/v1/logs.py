@@ -1,16 +1,83 @@
-from fastapi import APIRouter, HTTPException
+import datetime
+from typing import Literal, Optional
 
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+
+from backend.config import config
 from backend.middlewares.uniform_response import uniform_response_middleware
-from backend.schemas import LogSchema
-from backend.services.cache import get_logs_from_cache
+from backend.schemas import LogSchema, ResponseWrapper, LogArchiveSegment
+from backend.services.cache import get_logs_page, get_packed_logs_page
+from backend.services.log_archive import log_archive
+from backend.services.log_export import LOG_EXPORT_MEDIA_TYPES, open_logs_export
 
 router = APIRouter()
 
 
 @router.get("/logs", response_model=list[LogSchema])
 @uniform_response_middleware
-async def get_logs():
+async def get_logs(
+        limit: int = Query(100, ge=1, le=config.logs_page_max_size),
+        cursor: Optional[str] = None,
+        user_name: Optional[str] = None,
+        action: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+        accept: Optional[str] = Header(None),
+):
+    try:
+        if accept and "application/msgpack" in accept:
+            body, next_cursor = await get_packed_logs_page(limit, cursor, user_name, action, start_time, end_time)
+            headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+            return Response(content=body, media_type="application/msgpack", headers=headers)
+
+        logs, next_cursor = await get_logs_page(limit, cursor, user_name, action, start_time, end_time)
+        return ResponseWrapper(data=logs, success=True, meta={"next_cursor": next_cursor})
+    except ValueError as exception:
+        raise HTTPException(status_code=400, detail=str(exception))
+    except Exception as exception:
+        raise HTTPException(status_code=500, detail=str(exception))
+
+
+@router.get("/logs/export")
+@uniform_response_middleware
+async def export_logs_stream(
+        export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+        user_name: Optional[str] = None,
+        action: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+):
     try:
-        return await get_logs_from_cache()
+        chunks = await open_logs_export(
+            export_format, user_name=user_name, action=action, start_time=start_time, end_time=end_time
+        )
     except Exception as exception:
         raise HTTPException(status_code=500, detail=str(exception))
+
+    filename = f"logs-{datetime.datetime.now(datetime.timezone.utc):%Y%m%d%H%M%S}.{export_format}"
+    return StreamingResponse(
+        chunks,
+        media_type=LOG_EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/logs/archive", response_model=list[LogArchiveSegment])
+@uniform_response_middleware
+async def get_logs_archive_segments():
+    try:
+        return log_archive.list_segments()
+    except Exception as exception:
+        raise HTTPException(status_code=500, detail=str(exception))
+
+
+@router.get("/logs/archive/{segment}")
+async def export_logs_archive_segment(segment: str):
+    try:
+        path = log_archive.get_segment_path(segment)
+    except FileNotFoundError as exception:
+        response = ResponseWrapper(data=None, success=False, error=str(exception))
+        return JSONResponse(content=response.model_dump(), status_code=404)
+
+    return FileResponse(path, media_type="application/gzip", filename=segment)
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, HTTPException
+
+from backend.middlewares.uniform_response import uniform_response_middleware
+from backend.services.auth_cache import access_cache, token_cache
+from backend.services.database import database
+from backend.services.guild_cache import guild_cache
+from backend.services.log_writer import log_writer
+from backend.services.response_cache import response_cache
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+@uniform_response_middleware
+async def get_metrics():
+    try:
+        return {
+            "fetch_sources": guild_cache.get_stats(),
+            "token_cache": token_cache.get_stats(),
+            "access_cache": access_cache.get_stats(),
+            "response_cache": response_cache.get_stats(),
+            "database": database.get_stats(),
+            "log_writer": log_writer.get_stats(),
+        }
+    except Exception as exception:
+        raise HTTPException(status_code=500, detail=str(exception))
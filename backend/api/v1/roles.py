@@ -2,13 +2,15 @@ import disnake
 from fastapi import APIRouter, HTTPException, Body
 
 from backend.middlewares.uniform_response import uniform_response_middleware
-from backend.schemas import Role, NameRequestBody, User
+from backend.schemas import Role, NameRequestBody, User, ResponseWrapper
 from backend.services.fetch import fetch_role, fetch_users_with_role, fetch_users_by_ids
 from backend.services.format import (
     format_editable_roles_response,
     format_non_editable_roles_response,
     format_users_with_role_response
 )
+from backend.services.response_cache import response_cache, ResponseCacheService
+from backend.services.role_sync import apply_role_plans, plan_member_roles
 from backend.utils.role import (
     create_target_role,
     rename_target_role,
@@ -46,7 +48,7 @@ async def create_role(request_body: NameRequestBody = Body(...)):
     try:
         name = request_body.name
         await create_target_role(name)
-        return await format_editable_roles_response()
+        return await format_editable_roles_response(force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except Exception as exception:
@@ -59,7 +61,7 @@ async def rename_role(role_id: int, request_body: NameRequestBody = Body(...)):
     try:
         role = await fetch_role(role_id)
         await rename_target_role(role, request_body.name)
-        return await format_editable_roles_response()
+        return await format_editable_roles_response(force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except Exception as exception:
@@ -72,7 +74,7 @@ async def delete_role(role_id: int):
     try:
         role = await fetch_role(role_id)
         await delete_target_role(role)
-        return await format_editable_roles_response()
+        return await format_editable_roles_response(force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except Exception as exception:
@@ -84,7 +86,11 @@ async def delete_role(role_id: int):
 async def get_role_holders(role_id: int):
     try:
         users = await fetch_users_with_role(role_id)
-        return await format_users_with_role_response(users)
+        return ResponseWrapper(
+            data=await format_users_with_role_response(users),
+            success=True,
+            meta={"total": len(users)}
+        )
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except Exception as exception:
@@ -96,17 +102,29 @@ async def get_role_holders(role_id: int):
 async def edit_role_holders(role_id: int, users_with_access: list[str] = Body(...)):
     try:
         old_users = await fetch_users_with_role(role_id)
-        new_users = await fetch_users_by_ids(users_with_access)
+        users_result = await fetch_users_by_ids(users_with_access)
+        new_users = users_result.found
         role = await fetch_role(role_id)
-
-        for user in old_users:
-            if user not in new_users:
-                await user.remove_roles(role)
-
-        for user in new_users:
-            await user.add_roles(role)
-
-        return await format_users_with_role_response(new_users)
+        new_users_ids = {user.id for user in new_users}
+
+        plans = [
+            plan_member_roles(user, remove=[role])
+            for user in old_users
+            if user.id not in new_users_ids
+        ]
+        plans.extend(plan_member_roles(user, add=[role]) for user in new_users)
+        sync_result = await apply_role_plans(plans)
+        await response_cache.invalidate(ResponseCacheService.USERS)
+
+        meta = sync_result.as_meta()
+        meta["errors"].update(users_result.errors)
+        return ResponseWrapper(
+            data=await format_users_with_role_response(
+                [user for user in new_users if user.id not in sync_result.failures]
+            ),
+            success=True,
+            meta=meta
+        )
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except Exception as exception:
@@ -1,20 +1,25 @@
+from typing import Literal, Optional
+
 import disnake
-from fastapi import APIRouter, HTTPException, Body
+from fastapi import APIRouter, HTTPException, Body, Query
 
+from backend.config import config
 from backend.middlewares.uniform_response import uniform_response_middleware
-from backend.schemas import User, NameRequestBody
+from backend.schemas import User, NameRequestBody, ResponseWrapper
 from backend.services.fetch import (
     fetch_roles_by_ids,
     fetch_user,
-    fetch_user_roles,
-    fetch_guild_default_role
+    fetch_user_roles
 )
 from backend.services.format import (
     format_users_response,
+    format_users_page_response,
+    format_users_search_response,
     format_roles_response,
     format_user_response,
     format_base_users_response
 )
+from backend.services.role_sync import apply_role_plans, plan_member_roles
 from backend.utils.user import kick_target_user, rename_target_user
 
 router = APIRouter()
@@ -22,9 +27,21 @@ router = APIRouter()
 
 @router.get("/users", response_model=list[User])
 @uniform_response_middleware
-async def get_users():
+async def get_users(
+        offset: int = Query(0, ge=0),
+        limit: Optional[int] = Query(None, ge=1, le=config.users_page_max_size),
+        search: Optional[str] = None,
+        group: Optional[Literal["staff", "student", "none"]] = None,
+        role_id: Optional[int] = Query(None, alias="role"),
+        order: Literal["asc", "desc"] = "asc",
+):
     try:
-        return await format_users_response()
+        users, total = await format_users_page_response(offset, limit, search, group, role_id, order == "desc")
+        return ResponseWrapper(
+            data=users,
+            success=True,
+            meta={"total": total, "offset": offset, "limit": limit}
+        )
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except Exception as exception:
@@ -42,13 +59,27 @@ async def get_base_users():
         raise HTTPException(status_code=500, detail=str(exception))
 
 
+@router.get("/users/search", response_model=list[User])
+@uniform_response_middleware
+async def search_users(
+        q: str = Query(..., min_length=1),
+        limit: int = Query(20, ge=1, le=config.users_search_max_size),
+):
+    try:
+        return await format_users_search_response(q, limit)
+    except disnake.errors.HTTPException as exception:
+        raise HTTPException(status_code=exception.status, detail=str(exception.text))
+    except Exception as exception:
+        raise HTTPException(status_code=500, detail=str(exception))
+
+
 @router.patch("/users/{user_id}", response_model=list[User])
 @uniform_response_middleware
 async def rename_user(user_id: int, request_body: NameRequestBody = Body(...)):
     try:
         user = await fetch_user(user_id)
         await rename_target_user(user, request_body.name)
-        return await format_users_response()
+        return await format_users_response(force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except Exception as exception:
@@ -84,23 +115,30 @@ async def get_user_roles(user_id: int):
 @uniform_response_middleware
 async def change_user_roles(user_id: int, roles: list[str] = Body(...)):
     try:
-        try:
-            new_roles = await fetch_roles_by_ids(roles)
-        except disnake.errors.HTTPException:
-            raise ValueError("Incorrect object in roles")
+        roles_result = await fetch_roles_by_ids(roles)
+        new_roles = roles_result.found
 
         user = await fetch_user(user_id)
         actual_roles = await fetch_user_roles(user)
-
-        default_role = await fetch_guild_default_role()
-        for role in actual_roles:
-            if role not in new_roles and role != default_role:
-                await user.remove_roles(role)
-
-        for role in new_roles:
-            await user.add_roles(role)
-
-        return await format_users_response()
+        new_roles_ids = {role.id for role in new_roles}
+
+        sync_result = await apply_role_plans([
+            plan_member_roles(
+                user,
+                add=new_roles,
+                remove=[role for role in actual_roles if role.id not in new_roles_ids]
+            )
+        ])
+        if sync_result.failures:
+            raise sync_result.failures[user.id]
+
+        meta = sync_result.as_meta()
+        meta["errors"].update(roles_result.errors)
+        return ResponseWrapper(
+            data=await format_users_response(force_refresh=True),
+            success=True,
+            meta=meta
+        )
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except Exception as exception:
@@ -113,7 +151,7 @@ async def kick_user(user_id: int):
     try:
         user = await fetch_user(user_id)
         await kick_target_user(user)
-        return await format_users_response()
+        return await format_users_response(force_refresh=True)
     except disnake.errors.HTTPException as exception:
         raise HTTPException(status_code=exception.status, detail=str(exception.text))
     except Exception as exception:
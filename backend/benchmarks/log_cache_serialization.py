@@ -0,0 +1,52 @@
+import argparse
+import datetime
+import json
+
+from backend.benchmarks.timing import measure
+from backend.schemas import LogSchema
+from backend.services.log_codec import decode_log, encode_log, pack_logs
+
+
+def generate_logs(count: int) -> list[LogSchema]:
+    started_at = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        LogSchema(
+            id=index,
+            user_name=f"user_{index % 500}",
+            action=f"Змінено ролі користувача {index % 2000}",
+            event_time=(started_at + datetime.timedelta(seconds=index)).isoformat(),
+        )
+        for index in range(count)
+    ]
+
+
+def run(count: int, repeats: int) -> None:
+    logs = generate_logs(count)
+    json_members = [json.dumps(log.model_dump()).encode() for log in logs]
+    packed_members = [encode_log(log) for log in logs]
+
+    results = {
+        "json + pydantic validation": measure(
+            lambda: [LogSchema(**json.loads(member)) for member in json_members], repeats
+        ),
+        "msgpack + model_construct": measure(
+            lambda: [decode_log(member) for member in packed_members], repeats
+        ),
+        "msgpack pass-through": measure(lambda: pack_logs(packed_members), repeats),
+    }
+
+    json_size = sum(map(len, json_members))
+    packed_size = sum(map(len, packed_members))
+    print(f"{count} rows, cached size: json {json_size / 1024:.0f} KiB, msgpack {packed_size / 1024:.0f} KiB")
+    for name, timing in results.items():
+        print(f"  {name:<28} {timing * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure decode latency of cached log rows")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    for size in arguments.sizes:
+        run(size, arguments.repeats)
@@ -0,0 +1,49 @@
+import argparse
+import random
+
+from backend.benchmarks.timing import measure
+from backend.services.member_search import MemberSearchService
+
+FIRST_NAMES = ["Марʼяна", "Мар'яна", "Мар’яна", "Олексій", "Юлія", "Андрій", "Софія", "Дмитро", "Anna", "Oliver"]
+LAST_NAMES = ["Шевченко", "Коваленко", "Бондаренко", "Ткаченко", "Кравчук", "Smith", "Nowak", "O'Brien"]
+APOSTROPHE_QUERIES = ["мар'я", "марʼя", "мар’я", "марʹя", "мар`я"]
+
+
+def check_apostrophes() -> None:
+    search = MemberSearchService()
+    search.build([(1, "Мар'яна"), (2, "Марʼяна"), (3, "Мар’яна"), (4, "Марія")])
+    for query in APOSTROPHE_QUERIES:
+        assert search.match(query) == {1, 2, 3}, query
+
+
+def generate_names(count: int) -> list[tuple[int, str]]:
+    return [
+        (member_id, f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)} {member_id % 1000}")
+        for member_id in range(count)
+    ]
+
+
+def run(count: int, repeats: int) -> None:
+    search = MemberSearchService()
+    names = generate_names(count)
+
+    results = {
+        "build": measure(lambda: search.build(names), repeats),
+        "prefix query": measure(lambda: search.search("ол", 20), repeats),
+        "trigram query": measure(lambda: search.search("мар'яна ков", 20), repeats),
+    }
+
+    print(f"{count} members")
+    for name, timing in results.items():
+        print(f"  {name:<16} {timing * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure member search index latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeats", type=int, default=5)
+    arguments = parser.parse_args()
+
+    check_apostrophes()
+    for size in arguments.sizes:
+        run(size, arguments.repeats)
@@ -0,0 +1,11 @@
+import time
+from typing import Callable
+
+
+def measure(func: Callable[[], object], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
@@ -0,0 +1,98 @@
+import argparse
+import asyncio
+import random
+
+from disnake import Member
+from disnake.utils import SnowflakeList
+
+from backend.benchmarks.timing import measure
+from backend.config import config
+from backend.services.role_index import role_index
+from backend.utils.user import classify_user_group, classify_user_groups
+
+
+class BenchmarkRole:
+    def __init__(self, role_id: int, position: int):
+        self.id = role_id
+        self.position = position
+
+    def __lt__(self, other: "BenchmarkRole") -> bool:
+        return (self.position, self.id) < (other.position, other.id)
+
+
+class BenchmarkGuild:
+    def __init__(self, roles: list[BenchmarkRole]):
+        self.id = config.guild_id
+        self.chunked = True
+        self.members: list[BenchmarkMember] = []
+        self._roles = {role.id: role for role in roles}
+        self.default_role = BenchmarkRole(0, 0)
+
+    def get_role(self, role_id: int) -> BenchmarkRole | None:
+        return self._roles.get(role_id)
+
+
+class BenchmarkMember:
+    roles = Member.roles
+    get_role = Member.get_role
+
+    def __init__(self, member_id: int, guild: BenchmarkGuild, roles_ids: list[int]):
+        self.id = member_id
+        self.bot = False
+        self.guild = guild
+        self._roles = SnowflakeList(roles_ids)
+
+
+def generate_members(count: int) -> list[BenchmarkMember]:
+    group_roles_ids = [config.administrator_role_id, config.teacher_role_id, config.student_role_id]
+    other_roles_ids = list(range(1_000, 1_030))
+    guild = BenchmarkGuild([
+        BenchmarkRole(role_id, position)
+        for position, role_id in enumerate(group_roles_ids + other_roles_ids, start=1)
+    ])
+    guild.members = [
+        BenchmarkMember(
+            member_id,
+            guild,
+            random.sample(other_roles_ids, 3) + random.choices(group_roles_ids, weights=[1, 5, 80])[:random.randint(0, 1)],
+        )
+        for member_id in range(10_000, 10_000 + count)
+    ]
+    role_index.build(guild)
+    return guild.members
+
+
+async def classify_per_member(members: list[BenchmarkMember], owner_id: int) -> list[tuple[str | None, bool]]:
+    async def get_user_group(member: BenchmarkMember) -> tuple[str | None, bool]:
+        roles_ids = [role.id for role in member.roles]
+        return classify_user_group(roles_ids, member.id, owner_id)
+
+    return [await get_user_group(member) for member in members]
+
+
+def run(count: int, repeats: int) -> None:
+    members = generate_members(count)
+    owner_id = members[0].id
+    expected_groups = asyncio.run(classify_per_member(members, owner_id))
+    assert expected_groups == classify_user_groups(members, owner_id)
+    assert expected_groups == classify_user_groups(members, owner_id, use_role_index=True)
+
+    results = {
+        "awaited get_user_group": measure(lambda: asyncio.run(classify_per_member(members, owner_id)), repeats),
+        "batch, member roles": measure(lambda: classify_user_groups(members, owner_id), repeats),
+        "batch, role index": measure(lambda: classify_user_groups(members, owner_id, use_role_index=True), repeats),
+    }
+
+    print(f"{count} members")
+    for name, timing in results.items():
+        print(f"  {name:<24} {timing * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure member group classification latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeats", type=int, default=5)
+    arguments = parser.parse_args()
+
+    for size in arguments.sizes:
+        run(size, arguments.repeats)
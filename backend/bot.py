@@ -2,6 +2,12 @@ import disnake
 from disnake.ext import commands
 
 from backend.config import config, logger
+from backend.services.auth_cache import access_cache
+from backend.services.channel_index import channel_index
+from backend.services.member_index import member_index
+from backend.services.response_cache import response_cache, ResponseCacheService
+from backend.services.role_index import role_index
+from backend.services.server_config import server_config
 from backend.services.bot_utils import (
     handle_role_selection,
     handle_user_selection_for_queue_switch,
@@ -25,6 +31,100 @@ async def run_bot():
 async def on_ready():
     logger.info(f"Bot is ready. Logged in as {bot.user}")
 
+    guild = bot.get_guild(config.guild_id)
+    if guild:
+        channel_index.build(guild)
+        role_index.build(guild)
+        if guild.chunked:
+            member_index.build(guild.owner_id, guild.members)
+        else:
+            member_index.invalidate()
+        await response_cache.invalidate(
+            ResponseCacheService.CHANNELS,
+            ResponseCacheService.ROLES,
+            ResponseCacheService.USERS,
+        )
+
+
+@bot.event
+async def on_guild_channel_create(channel: disnake.abc.GuildChannel) -> None:
+    channel_index.upsert(channel)
+    await response_cache.invalidate(ResponseCacheService.CHANNELS)
+
+
+@bot.event
+async def on_guild_channel_update(before: disnake.abc.GuildChannel, after: disnake.abc.GuildChannel) -> None:
+    channel_index.upsert(after)
+    await response_cache.invalidate(ResponseCacheService.CHANNELS)
+
+
+@bot.event
+async def on_guild_channel_delete(channel: disnake.abc.GuildChannel) -> None:
+    channel_index.remove(channel.id)
+    await response_cache.invalidate(ResponseCacheService.CHANNELS)
+
+
+@bot.event
+async def on_guild_update(before: disnake.Guild, after: disnake.Guild) -> None:
+    if before.owner_id != after.owner_id:
+        access_cache.invalidate(before.owner_id)
+        access_cache.invalidate(after.owner_id)
+        member_index.update_owner(
+            after.owner_id,
+            [member for member in (after.get_member(before.owner_id), after.get_member(after.owner_id)) if member]
+        )
+        await response_cache.invalidate(ResponseCacheService.USERS)
+
+
+@bot.event
+async def on_guild_role_create(role: disnake.Role) -> None:
+    await response_cache.invalidate(ResponseCacheService.ROLES)
+
+
+@bot.event
+async def on_guild_role_update(before: disnake.Role, after: disnake.Role) -> None:
+    await response_cache.invalidate(ResponseCacheService.ROLES)
+
+
+@bot.event
+async def on_guild_role_delete(role: disnake.Role) -> None:
+    role_index.remove_role(role.id)
+    access_cache.clear()
+    if role.id in (config.administrator_role_id, config.teacher_role_id, config.student_role_id):
+        member_index.invalidate()
+    await response_cache.invalidate(ResponseCacheService.ROLES)
+
+
+@bot.event
+async def on_member_join(member: disnake.Member) -> None:
+    role_index.upsert(member)
+    member_index.upsert(member)
+    await response_cache.invalidate(ResponseCacheService.USERS)
+
+
+@bot.event
+async def on_member_update(before: disnake.Member, after: disnake.Member) -> None:
+    role_index.upsert(after)
+    member_index.upsert(after)
+    if before.roles != after.roles:
+        access_cache.invalidate(after.id)
+    await response_cache.invalidate(ResponseCacheService.USERS)
+
+
+@bot.event
+async def on_member_remove(member: disnake.Member) -> None:
+    role_index.remove(member.id)
+    member_index.remove(member.id)
+    access_cache.invalidate(member.id)
+    await response_cache.invalidate(ResponseCacheService.USERS)
+
+
+@bot.event
+async def on_raw_message_delete(payload: disnake.RawMessageDeleteEvent) -> None:
+    current_config = await server_config.get_config()
+    if str(payload.message_id) in (current_config.registration.message_id, current_config.staff.message_id):
+        await response_cache.invalidate(ResponseCacheService.SETTINGS)
+
 
 @bot.event
 async def on_dropdown(interaction: disnake.MessageInteraction) -> None:
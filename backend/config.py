@@ -22,11 +22,38 @@ class Config:
         self.supabase_url = self._get_env_variable("VITE_SUPABASE_URL")
         self.supabase_key = self._get_env_variable("VITE_SUPABASE_SERVICE_ROLE_KEY")
         self.redis_url = self._get_env_variable("REDIS_URL")
+        self.supabase_jwt_secret = self._get_optional_env_variable("SUPABASE_JWT_SECRET")
+        self.supabase_jwks_url = self._get_optional_env_variable("SUPABASE_JWKS_URL")
+        self.supabase_jwt_audience = self._get_optional_env_variable("SUPABASE_JWT_AUDIENCE", "authenticated")
+        self.supabase_jwt_local_verification = bool(self.supabase_jwt_secret or self.supabase_jwks_url)
 
         self.frontend_url = self._get_env_variable("FRONTEND_URL")
         self.registration_embed_image_url = "https://imgur.com/uG2M5wK.png"
 
-        self.redis_logs_key = "discord_admin_panel:logs"
+        self.redis_logs_key = "discord_admin_panel:logs:recent:v2"
+        self.redis_logs_complete_key = "discord_admin_panel:logs:complete:v2"
+        self.redis_logs_cache_size = 1000
+        self.logs_page_max_size = 1000
+        self.users_page_max_size = 1000
+        self.users_search_max_size = 100
+        self.logs_retention_days = int(self._get_optional_env_variable("LOGS_RETENTION_DAYS", "0"))
+        self.logs_archive_segment_size = 10000
+        self.logs_export_chunk_size = 500
+        self.discord_fetch_concurrency = 8
+        self.discord_edit_concurrency = 4
+        self.token_cache_expiry_margin = 30
+        self.token_cache_max_size = 1024
+        self.access_cache_ttl = 300
+        self.response_cache_ttl = 60
+        self.response_cache_redis = self._get_optional_env_variable("RESPONSE_CACHE_REDIS", "false").lower() == "true"
+        self.redis_response_cache_prefix = "discord_admin_panel:responses"
+        self.redis_response_versions_key = "discord_admin_panel:responses:versions"
+        self.database_pool_min_size = int(self._get_optional_env_variable("DATABASE_POOL_MIN_SIZE", "1"))
+        self.database_pool_max_size = int(self._get_optional_env_variable("DATABASE_POOL_MAX_SIZE", "5"))
+        self.database_statement_cache_size = 100
+        self.log_writer_max_queue_size = 1000
+        self.log_writer_batch_size = 100
+        self.log_writer_flush_interval = 0.25
         self.locales = ["en", "uk"]
 
         current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -46,6 +73,10 @@ class Config:
         )
         return logging.getLogger("uvicorn")
 
+    @staticmethod
+    def _get_optional_env_variable(var_name: str, default: Optional[str] = None) -> Optional[str]:
+        return os.environ.get(var_name) or default
+
     def _get_env_variable(self, var_name: str) -> Optional[str]:
         value = os.environ.get(var_name)
         if not value:
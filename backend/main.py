@@ -7,26 +7,45 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from backend.api.v1.router import router as router_v1
 from backend.bot import bot, run_bot
+from backend.config import logger
 from backend.middlewares.authorization import AuthMiddleware
-from backend.services.cache import update_logs_cache
+from backend.middlewares.supabase import ensure_logs_table
+from backend.services.database import database
+from backend.services.log_archive import log_archive
+from backend.services.log_writer import log_writer
 
 
 async def refresh_cache():
     while True:
-        await update_logs_cache()
+        try:
+            await log_archive.compact()
+        except Exception as exception:
+            logger.error(f"Logs archiving failed: {exception}")
+        try:
+            await log_writer.rebuild_cache()
+        except Exception as exception:
+            logger.error(f"Logs cache refresh failed: {exception}")
         await asyncio.sleep(datetime.timedelta(days=1).total_seconds())
 
 
 @asynccontextmanager
 async def lifespan(*args, **kwargs):
+    try:
+        await ensure_logs_table()
+    except Exception as exception:
+        logger.error(f"Logs table bootstrap failed, retrying on first use: {exception}")
+
     bot_task = asyncio.create_task(run_bot())
     cache_task = asyncio.create_task(refresh_cache())
+    log_writer.start()
     try:
         yield
     finally:
+        await log_writer.stop()
         await bot.close()
         bot_task.cancel()
         cache_task.cancel()
+        await database.close()
 
 
 app = FastAPI(
@@ -42,7 +61,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_origins=["*"],
     allow_methods=["GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"],
-    allow_headers=["*"]
+    allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"]
 )
 
 app.include_router(router_v1, prefix="/api")
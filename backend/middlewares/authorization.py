@@ -3,19 +3,56 @@ from typing import Optional
 from urllib.parse import unquote
 
 import disnake
+import jwt
 from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from backend.config import config
 from backend.schemas import ResponseWrapper
-from backend.services.cache import update_logs_cache
+from backend.services.auth_cache import access_cache, token_cache
 from backend.services.fetch import fetch_user
-from backend.services.supabase_client import supabase, save_log_to_supabase
+from backend.services.log_writer import log_writer
+from backend.services.supabase_client import supabase
 from backend.utils.user import get_user_group
 
 from gotrue.errors import AuthApiError
 
 
+jwks_client = jwt.PyJWKClient(config.supabase_jwks_url) if config.supabase_jwks_url else None
+
+
+async def verify_token_locally(token: str) -> Optional[dict]:
+    try:
+        if jwks_client:
+            signing_key = await asyncio.to_thread(jwks_client.get_signing_key_from_jwt, token)
+            key, algorithms = signing_key.key, ["RS256", "ES256"]
+        else:
+            key, algorithms = config.supabase_jwt_secret, ["HS256"]
+
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=algorithms,
+            audience=config.supabase_jwt_audience,
+            options={"require": ["exp", "aud", "sub"]},
+        )
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    return claims.get("user_metadata")
+
+
+async def verify_token_remotely(token: str) -> Optional[dict]:
+    user_metadata = token_cache.get(token)
+    if user_metadata is None:
+        user_data = await asyncio.to_thread(supabase.auth.get_user, token)
+        if user_data and user_data.user and user_data.user.user_metadata:
+            user_metadata = user_data.user.user_metadata
+            token_cache.set(token, user_metadata)
+    return user_metadata
+
+
 class AuthMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         if request.method == "OPTIONS" or request.url.path in ["/", "/docs", "/openapi.json"]:
@@ -28,18 +65,26 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 raise HTTPException(status_code=401, detail="Missing or invalid Authorization header")
 
             token = authorization.split(" ")[1]
-            user_data = supabase.auth.get_user(token)
+            if config.supabase_jwt_local_verification:
+                user_metadata = await verify_token_locally(token)
+            else:
+                user_metadata = await verify_token_remotely(token)
+
+            if user_metadata:
+                user_id = int(user_metadata["provider_id"])
+                access = access_cache.get(user_id)
+                if access is None:
+                    access = await get_user_group(await fetch_user(user_id))
+                    access_cache.set(user_id, access)
 
-            if user_data.user and user_data.user.user_metadata:
-                user = await fetch_user(user_data.user.user_metadata["provider_id"])
-                user_group, _ = await get_user_group(user)
+                user_group, _ = access
                 if user_group and user_group == "staff":
-                    request.state.user = user_data.user
+                    request.state.user = user_metadata
                     action = request.headers.get("X-Request-Source-Method")
                     if action:
+                        user = await fetch_user(user_id)
                         action_text = unquote(action)
-                        asyncio.create_task(save_log_to_supabase(user, action_text))
-                        asyncio.create_task(update_logs_cache())
+                        log_writer.enqueue(user, action_text)
                     response = await call_next(request)
                     return response
                 else:
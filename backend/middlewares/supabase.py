@@ -1,44 +1,49 @@
+import asyncio
 import functools
 
-import psycopg2
+import asyncpg
 
-from backend.config import config
+from backend.config import logger
+from backend.services.database import database
 
+_logs_table_ready = False
+_logs_table_lock = asyncio.Lock()
 
-def logs_table_exists(func):
-    @functools.wraps(func)
-    async def wrapper(*args, **kwargs):
-        conn, cur = None, None
-        try:
-            conn = psycopg2.connect(config.supabase_direct_url)
-            cur = conn.cursor()
 
-            cur.execute("SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'logs');")
-            table_exists = cur.fetchone()[0]
+async def ensure_logs_table() -> None:
+    global _logs_table_ready
+    if _logs_table_ready:
+        return
 
-            if not table_exists:
-                create_table_sql = """
+    async with _logs_table_lock:
+        if not _logs_table_ready:
+            async with database.acquire() as connection:
+                await connection.execute("""
                 CREATE TABLE IF NOT EXISTS logs (
                     id SERIAL PRIMARY KEY,
                     user_name TEXT,
                     action TEXT,
                     event_time TIMESTAMPTZ
                 );
-                """
-                cur.execute(create_table_sql)
-                conn.commit()
-
-        except (Exception, psycopg2.Error):
-            if conn:
-                conn.rollback()
-            raise
+                CREATE INDEX IF NOT EXISTS logs_event_time_id_idx ON logs (event_time DESC, id DESC);
+                CREATE INDEX IF NOT EXISTS logs_user_name_event_time_id_idx
+                    ON logs (user_name, event_time DESC, id DESC);
+                """)
+                try:
+                    await connection.execute("""
+                    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                    CREATE INDEX IF NOT EXISTS logs_action_trgm_idx ON logs USING gin (action gin_trgm_ops);
+                    """)
+                except asyncpg.PostgresError as error:
+                    logger.warning(f"Trigram index on logs.action is unavailable: {error}")
+            _logs_table_ready = True
+            logger.info("Logs table is ready")
 
-        finally:
-            if conn:
-                if cur:
-                    cur.close()
-                conn.close()
 
+def logs_table_exists(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        await ensure_logs_table()
         return await func(*args, **kwargs)
 
     return wrapper
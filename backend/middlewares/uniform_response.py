@@ -1,18 +1,61 @@
+import inspect
 from functools import wraps
+from typing import Callable
 
+from fastapi import Request
 from fastapi.exceptions import HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from backend.schemas import ResponseWrapper
+from backend.services.response_cache import response_cache, served_versions
+
+_endpoint_tags: dict[Callable, tuple[str, ...]] = {}
+
+
+async def _get_current_etag(func: Callable) -> str | None:
+    tags = _endpoint_tags.get(func)
+    if not tags:
+        return None
+
+    versions = await response_cache.get_versions(tags)
+    if versions is None:
+        return None
+    return response_cache.get_etag(dict(zip(tags, versions)))
 
 
 def uniform_response_middleware(func):
+    signature = inspect.signature(func)
+    accepts_request = "request" in signature.parameters
+
     @wraps(func)
-    async def wrapper(*args, **kwargs):
+    async def wrapper(*args, request: Request, **kwargs):
         try:
-            result = await func(*args, **kwargs)
-            response = ResponseWrapper(data=result, success=True, error=None)
-            return JSONResponse(content=response.model_dump())
+            if request.method == "GET" and (if_none_match := request.headers.get("if-none-match")):
+                etag = await _get_current_etag(func)
+                if etag and etag in [value.strip() for value in if_none_match.split(",")]:
+                    return Response(status_code=304, headers={"ETag": etag})
+
+            if accepts_request:
+                kwargs["request"] = request
+            served = {}
+            token = served_versions.set(served)
+            try:
+                result = await func(*args, **kwargs)
+            finally:
+                served_versions.reset(token)
+
+            if isinstance(result, Response):
+                return result
+            if isinstance(result, ResponseWrapper):
+                response = result
+            else:
+                response = ResponseWrapper(data=result, success=True, error=None)
+
+            headers = None
+            if request.method == "GET" and served:
+                _endpoint_tags[func] = tuple(sorted(served))
+                headers = {"ETag": response_cache.get_etag(served), "Cache-Control": "private, no-cache"}
+            return JSONResponse(content=response.model_dump(), headers=headers)
 
         except Exception as exception:
             response = ResponseWrapper(data=None, success=False, error=str(exception))
@@ -20,4 +63,9 @@ def uniform_response_middleware(func):
                 return JSONResponse(content=response.model_dump(), status_code=exception.status_code)
             return JSONResponse(content=response.model_dump(), status_code=500)
 
+    if not accepts_request:
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+        ])
     return wrapper
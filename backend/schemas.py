@@ -7,6 +7,7 @@ class ResponseWrapper(BaseModel):
     data: Optional[Any] = None
     success: bool
     error: Optional[str] = None
+    meta: Optional[dict[str, Any]] = None
 
 
 class BaseChannel(BaseModel):
@@ -38,6 +39,24 @@ class Role(BaseRole):
     name: str
 
 
+class CategoryTree(Category):
+    channels: list[Channel]
+    roles_with_access: list[str]
+
+
+class CategoryAccessMatrix(BaseModel):
+    role_ids: list[str]
+    category_ids: list[str]
+    matrix: list[list[bool]]
+
+
+class GuildTree(BaseModel):
+    categories: list[CategoryTree]
+    channels_without_category: list[Channel]
+    roles: list[Role]
+    users: list[User]
+
+
 class NameRequestBody(BaseModel):
     name: str
 
@@ -47,11 +66,17 @@ class PositionRequestBody(BaseModel):
 
 
 class LogSchema(BaseModel):
+    id: Optional[int] = None
     user_name: str
     action: str
     event_time: str
 
 
+class LogArchiveSegment(BaseModel):
+    name: str
+    size: int
+
+
 class QueueRequestBody(BaseModel):
     channel_id: str
     title: str
@@ -100,3 +125,8 @@ class ServerConfigExtended(BaseModel):
     language: Optional[str] = None
     registration: RegistrationConfigInfoExtended
     staff: StaffConfigInfoExtended
+
+
+class Bootstrap(BaseModel):
+    guild: GuildTree
+    config: ServerConfigExtended
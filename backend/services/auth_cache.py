@@ -0,0 +1,105 @@
+import base64
+import binascii
+import hashlib
+import json
+import time
+from typing import Any, Optional
+
+from backend.config import config
+
+
+class TokenCacheService:
+    def __init__(self, expiry_margin: int, max_size: int):
+        self._expiry_margin = expiry_margin
+        self._max_size = max_size
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _hash_token(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @staticmethod
+    def _get_token_expiry(token: str) -> Optional[float]:
+        try:
+            payload = token.split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload))
+            return float(claims["exp"])
+        except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+            return None
+
+    def get(self, token: str) -> Optional[Any]:
+        entry = self._entries.get(self._hash_token(token))
+        if entry is None or entry[0] <= time.time():
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry[1]
+
+    def set(self, token: str, user: Any) -> None:
+        expiry = self._get_token_expiry(token)
+        if expiry is None:
+            return
+
+        expires_at = expiry - self._expiry_margin
+        if expires_at <= time.time():
+            return
+
+        if len(self._entries) >= self._max_size:
+            self._evict()
+        self._entries[self._hash_token(token)] = (expires_at, user)
+
+    def _evict(self) -> None:
+        now = time.time()
+        for token_hash in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[token_hash]
+
+        while len(self._entries) >= self._max_size:
+            del self._entries[next(iter(self._entries))]
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class AccessCacheService:
+    def __init__(self, ttl: int):
+        self._ttl = ttl
+        self._entries: dict[int, tuple[float, tuple[str | None, bool]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[tuple[str | None, bool]]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] <= time.time():
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry[1]
+
+    def set(self, user_id: int, access: tuple[str | None, bool]) -> None:
+        self._entries[user_id] = (time.time() + self._ttl, access)
+
+    def invalidate(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+token_cache = TokenCacheService(config.token_cache_expiry_margin, config.token_cache_max_size)
+access_cache = AccessCacheService(config.access_cache_ttl)
@@ -1,36 +1,150 @@
-import json
+import base64
+import binascii
+import datetime
+from typing import Optional
 
 import redis.asyncio as redis
 import redis.exceptions as exceptions
 
 from backend.config import config, logger
 from backend.schemas import LogSchema
-from backend.services.supabase_client import read_logs_from_supabase
+from backend.services.log_codec import decode_log, encode_log, encode_logs, pack_logs
+from backend.services.supabase_client import read_logs_from_supabase, read_logs_page_from_supabase
 
 redis_client = redis.Redis.from_url(config.redis_url)
 
 
+def _serialize_logs(logs: list[LogSchema]) -> dict[bytes, float]:
+    return {
+        encode_log(log): datetime.datetime.fromisoformat(log.event_time).timestamp()
+        for log in logs
+    }
+
+
+def encode_logs_cursor(log: LogSchema) -> str:
+    return base64.urlsafe_b64encode(f"{log.event_time}|{log.id}".encode()).decode()
+
+
+def decode_logs_cursor(cursor: str) -> tuple[datetime.datetime, int]:
+    try:
+        event_time, log_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.datetime.fromisoformat(event_time), int(log_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
 async def set_logs_to_cache(logs: list[LogSchema]):
     try:
-        serialized_logs = [log.model_dump() for log in logs]
-        await redis_client.set(config.redis_logs_key, json.dumps(serialized_logs))
+        async with redis_client.pipeline(transaction=True) as pipeline:
+            pipeline.delete(config.redis_logs_key)
+            if logs:
+                pipeline.zadd(config.redis_logs_key, _serialize_logs(logs))
+            pipeline.set(config.redis_logs_complete_key, 1)
+            await pipeline.execute()
     except exceptions.ConnectionError as error:
         logger.error(f"Redis connection error: {error}")
 
 
-async def get_logs_from_cache() -> list[LogSchema]:
+async def append_logs_to_cache(logs: list[LogSchema]):
+    if not logs:
+        return
+
     try:
-        cached_logs = await redis_client.get(config.redis_logs_key)
-        if cached_logs:
-            deserialized_logs = json.loads(cached_logs)
-            return [LogSchema(**log) for log in deserialized_logs]
+        async with redis_client.pipeline(transaction=True) as pipeline:
+            pipeline.zadd(config.redis_logs_key, _serialize_logs(logs))
+            pipeline.zremrangebyrank(config.redis_logs_key, 0, -config.redis_logs_cache_size - 1)
+            await pipeline.execute()
+    except exceptions.ConnectionError as error:
+        logger.error(f"Redis connection error: {error}")
+
+
+def _is_cached_page(
+        limit: int,
+        cursor: Optional[str],
+        user_name: Optional[str],
+        action: Optional[str],
+        start_time: Optional[datetime.datetime],
+        end_time: Optional[datetime.datetime],
+) -> bool:
+    return not any((cursor, user_name, action, start_time, end_time)) and limit <= config.redis_logs_cache_size
+
+
+async def _read_cached_logs(limit: int) -> Optional[list[bytes]]:
+    try:
+        async with redis_client.pipeline(transaction=True) as pipeline:
+            pipeline.exists(config.redis_logs_complete_key)
+            pipeline.zrevrange(config.redis_logs_key, 0, limit)
+            is_complete, cached_logs = await pipeline.execute()
+        if is_complete:
+            return cached_logs
     except exceptions.ConnectionError as error:
         logger.error(f"Redis connection error: {error}, falling back to Supabase")
-    return await read_logs_from_supabase()
+    return None
+
+
+def _get_next_cursor(logs: list, limit: int, decode=lambda log: log) -> Optional[str]:
+    if len(logs) > limit:
+        return encode_logs_cursor(decode(logs[limit - 1]))
+    if len(logs) == limit == config.redis_logs_cache_size:
+        return encode_logs_cursor(decode(logs[-1]))
+    return None
+
+
+async def _read_logs_page(
+        limit: int,
+        cursor: Optional[str],
+        user_name: Optional[str],
+        action: Optional[str],
+        start_time: Optional[datetime.datetime],
+        end_time: Optional[datetime.datetime],
+) -> tuple[list[LogSchema], Optional[str]]:
+    logs = await read_logs_page_from_supabase(
+        limit + 1,
+        decode_logs_cursor(cursor) if cursor else None,
+        user_name,
+        action,
+        start_time,
+        end_time,
+    )
+    next_cursor = encode_logs_cursor(logs[limit - 1]) if len(logs) > limit else None
+    return logs[:limit], next_cursor
+
+
+async def get_logs_page(
+        limit: int,
+        cursor: Optional[str] = None,
+        user_name: Optional[str] = None,
+        action: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+) -> tuple[list[LogSchema], Optional[str]]:
+    if _is_cached_page(limit, cursor, user_name, action, start_time, end_time):
+        cached_logs = await _read_cached_logs(limit)
+        if cached_logs is not None:
+            logs = [decode_log(log) for log in cached_logs]
+            return logs[:limit], _get_next_cursor(logs, limit)
+
+    return await _read_logs_page(limit, cursor, user_name, action, start_time, end_time)
+
+
+async def get_packed_logs_page(
+        limit: int,
+        cursor: Optional[str] = None,
+        user_name: Optional[str] = None,
+        action: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+) -> tuple[bytes, Optional[str]]:
+    if _is_cached_page(limit, cursor, user_name, action, start_time, end_time):
+        cached_logs = await _read_cached_logs(limit)
+        if cached_logs is not None:
+            return pack_logs(cached_logs[:limit]), _get_next_cursor(cached_logs, limit, decode_log)
+
+    logs, next_cursor = await _read_logs_page(limit, cursor, user_name, action, start_time, end_time)
+    return encode_logs(logs), next_cursor
 
 
 async def update_logs_cache():
-    supabase_logs = await read_logs_from_supabase()
-    if supabase_logs:
-        await set_logs_to_cache(supabase_logs)
-        logger.info("Cache refreshed")
+    supabase_logs = await read_logs_from_supabase(config.redis_logs_cache_size)
+    await set_logs_to_cache(supabase_logs)
+    logger.info("Cache refreshed")
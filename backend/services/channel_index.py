@@ -0,0 +1,79 @@
+from bisect import bisect_left, insort
+from heapq import merge
+from typing import Optional
+
+from disnake import ChannelType, Guild
+from disnake.abc import GuildChannel
+
+from backend.config import config
+
+
+class ChannelIndexService:
+    def __init__(self, guild_id: int):
+        self._guild_id = guild_id
+        self._channels: dict[int, GuildChannel] = {}
+        self._entries: dict[int, tuple[Optional[int], ChannelType, tuple[int, int]]] = {}
+        self._ordering: dict[Optional[int], dict[ChannelType, list[tuple[int, int]]]] = {}
+        self.ready = False
+
+    def build(self, guild: Guild) -> None:
+        self._channels.clear()
+        self._entries.clear()
+        self._ordering.clear()
+        for channel in guild.channels:
+            self.upsert(channel)
+        self.ready = True
+
+    def upsert(self, channel: GuildChannel) -> None:
+        if channel.guild.id != self._guild_id:
+            return
+
+        self.remove(channel.id)
+        sort_key = (channel.position, channel.id)
+        self._channels[channel.id] = channel
+        self._entries[channel.id] = (channel.category_id, channel.type, sort_key)
+        by_type = self._ordering.setdefault(channel.category_id, {})
+        insort(by_type.setdefault(channel.type, []), sort_key)
+
+    def remove(self, channel_id: int) -> None:
+        entry = self._entries.pop(channel_id, None)
+        if entry is None:
+            return
+
+        category_id, channel_type, sort_key = entry
+        ordering = self._ordering[category_id][channel_type]
+        index = bisect_left(ordering, sort_key)
+        if index < len(ordering) and ordering[index] == sort_key:
+            del ordering[index]
+        self._channels.pop(channel_id, None)
+
+    def get_channels(
+            self,
+            category_id: Optional[int],
+            channel_type: Optional[ChannelType] = None
+    ) -> list[GuildChannel]:
+        by_type = self._ordering.get(category_id, {})
+        if channel_type is not None:
+            ordering = by_type.get(channel_type, [])
+        else:
+            ordering = merge(*by_type.values())
+        return [self._channels[channel_id] for _, channel_id in ordering]
+
+    def get_categories(self) -> list[GuildChannel]:
+        return self.get_channels(None, ChannelType.category)
+
+    def get_category_channels(self, category_id: int) -> list[GuildChannel]:
+        by_type = self._ordering.get(category_id, {})
+        text_channels = by_type.get(ChannelType.text, [])
+        other_channels = merge(*(
+            ordering for channel_type, ordering in by_type.items()
+            if channel_type != ChannelType.text
+        ))
+        return [
+            self._channels[channel_id]
+            for ordering in (text_channels, other_channels)
+            for _, channel_id in ordering
+        ]
+
+
+channel_index = ChannelIndexService(config.guild_id)
@@ -0,0 +1,66 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import asyncpg
+
+from backend.config import config
+
+
+class DatabaseService:
+    def __init__(self, dsn: str, min_size: int, max_size: int, statement_cache_size: int):
+        self._dsn = dsn
+        self._min_size = min_size
+        self._max_size = max_size
+        self._statement_cache_size = statement_cache_size
+        self._pool: Optional[asyncpg.Pool] = None
+        self._lock = asyncio.Lock()
+        self.acquisitions = 0
+        self.acquire_wait_total = 0.0
+
+    async def connect(self) -> asyncpg.Pool:
+        if self._pool is None:
+            async with self._lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        dsn=self._dsn,
+                        min_size=self._min_size,
+                        max_size=self._max_size,
+                        statement_cache_size=self._statement_cache_size,
+                    )
+        return self._pool
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[asyncpg.Connection]:
+        pool = await self.connect()
+        started = time.perf_counter()
+        async with pool.acquire() as connection:
+            self.acquisitions += 1
+            self.acquire_wait_total += time.perf_counter() - started
+            yield connection
+
+    def get_stats(self) -> dict[str, int | float]:
+        return {
+            "size": self._pool.get_size() if self._pool else 0,
+            "idle": self._pool.get_idle_size() if self._pool else 0,
+            "min_size": self._min_size,
+            "max_size": self._max_size,
+            "acquisitions": self.acquisitions,
+            "average_acquire_wait_ms": (
+                self.acquire_wait_total / self.acquisitions * 1000 if self.acquisitions else 0.0
+            ),
+        }
+
+
+database = DatabaseService(
+    config.supabase_direct_url,
+    config.database_pool_min_size,
+    config.database_pool_max_size,
+    config.database_statement_cache_size,
+)
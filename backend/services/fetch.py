@@ -1,4 +1,10 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+import disnake
 from disnake import (
+    ChannelType,
     Role,
     Member,
     VoiceChannel,
@@ -8,59 +14,163 @@ from disnake import (
     Message
 )
 
+from backend.config import config
+from backend.services.channel_index import channel_index
+from backend.services.guild_cache import guild_cache
+from backend.services.role_index import role_index
+
+
+@dataclass
+class BatchFetchResult:
+    found: list = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)
+
 
-async def fetch_guild() -> Guild:
+@dataclass
+class GuildSnapshot:
+    owner_id: int
+    default_role: Role
+    channels: list[VoiceChannel | TextChannel | CategoryChannel]
+    roles: list[Role]
+    members: list[Member]
+
+
+async def fetch_guild(force_refresh: bool = False) -> Guild:
     from backend.bot import bot
-    from backend.config import config
-    return await bot.fetch_guild(config.guild_id)
 
+    guild = None if force_refresh else guild_cache.get_guild()
+    if guild is not None:
+        guild_cache.record("fetch_guild", guild_cache.CACHE)
+        return guild
 
-async def fetch_roles_by_ids(roles: list) -> list[Role]:
-    guild = await fetch_guild()
-    return [
-        await guild.fetch_role(role_id)
-        for role_id in roles
-    ]
+    guild_cache.record("fetch_guild", guild_cache.REST)
+    return await bot.fetch_guild(config.guild_id)
 
 
-async def fetch_channels() -> list[VoiceChannel | TextChannel | CategoryChannel]:
-    guild = await fetch_guild()
-    channels_sequence = await guild.fetch_channels()
-    channels = list(channels_sequence)
+async def fetch_guild_snapshot(force_refresh: bool = False) -> GuildSnapshot:
+    guild = guild_cache.get_guild()
+    if guild is not None and guild.chunked and not force_refresh:
+        guild_cache.record("fetch_guild_snapshot", guild_cache.CACHE)
+        channels, roles, members = guild.channels, guild.roles, guild.members
+    else:
+        guild = guild or await fetch_guild()
+        guild_cache.record("fetch_guild_snapshot", guild_cache.REST)
+        channels, roles, members = await asyncio.gather(
+            guild.fetch_channels(),
+            guild.fetch_roles(),
+            guild.fetch_members().flatten(),
+        )
+
+    return GuildSnapshot(
+        owner_id=guild.owner_id,
+        default_role=guild.default_role,
+        channels=list(channels),
+        roles=list(roles),
+        members=[member for member in members if member.bot is False],
+    )
+
+
+async def fetch_roles_by_ids(roles: list) -> BatchFetchResult:
+    guild = guild_cache.get_guild()
+    get_cached = guild.get_role if guild is not None else None
+    return await _fetch_by_ids("fetch_roles_by_ids", roles, guild, get_cached, _fetch_remote_role)
+
+
+async def fetch_channels(force_refresh: bool = False) -> list[VoiceChannel | TextChannel | CategoryChannel]:
+    guild = guild_cache.get_guild()
+    if guild is not None and not force_refresh:
+        guild_cache.record("fetch_channels", guild_cache.CACHE)
+        channels = list(guild.channels)
+    else:
+        guild = guild or await fetch_guild()
+        guild_cache.record("fetch_channels", guild_cache.REST)
+        channels = list(await guild.fetch_channels())
     channels.sort(key=lambda c: (c.position, c.id))
     return channels
 
 
 async def fetch_channels_by_type(
-        channel_type: VoiceChannel | TextChannel | CategoryChannel
+        channel_type: VoiceChannel | TextChannel | CategoryChannel,
+        force_refresh: bool = False
 ) -> list[VoiceChannel | TextChannel | CategoryChannel]:
-    guild = await fetch_guild()
-    channels_sequence = [
-        channel for channel in await guild.fetch_channels()
+    return [
+        channel for channel in await fetch_channels(force_refresh)
         if channel.type == channel_type
     ]
-    channels = list(channels_sequence)
-    channels.sort(key=lambda c: (c.position, c.id))
-    return channels
 
 
-async def fetch_channels_by_category(category: CategoryChannel) -> list[TextChannel | VoiceChannel]:
+async def fetch_channels_by_category(
+        category: CategoryChannel,
+        force_refresh: bool = False
+) -> list[TextChannel | VoiceChannel]:
     return [
-        channel for channel in await fetch_channels()
+        channel for channel in await fetch_channels(force_refresh)
         if channel.category_id == category.id
     ]
 
 
-async def fetch_channel(channel_id: int) -> VoiceChannel | TextChannel | CategoryChannel:
-    guild = await fetch_guild()
-    channel = await guild.fetch_channel(channel_id)
-    return channel
+async def fetch_categories(force_refresh: bool = False) -> list[CategoryChannel]:
+    if channel_index.ready and not force_refresh:
+        guild_cache.record("fetch_categories", guild_cache.CACHE)
+        return channel_index.get_categories()
+
+    return await fetch_channels_by_type(ChannelType.category, force_refresh)
+
+
+async def fetch_category_channels(
+        category_id: int,
+        force_refresh: bool = False
+) -> list[TextChannel | VoiceChannel]:
+    if channel_index.ready and not force_refresh:
+        guild_cache.record("fetch_category_channels", guild_cache.CACHE)
+        return channel_index.get_category_channels(category_id)
+
+    channels = [
+        channel for channel in await fetch_channels(force_refresh)
+        if channel.category_id == category_id
+    ]
+    channels.sort(key=lambda channel: channel.type != ChannelType.text)
+    return channels
+
+
+async def fetch_text_channels_without_category(force_refresh: bool = False) -> list[TextChannel]:
+    if channel_index.ready and not force_refresh:
+        guild_cache.record("fetch_text_channels_without_category", guild_cache.CACHE)
+        return channel_index.get_channels(None, ChannelType.text)
+
+    return [
+        channel for channel in await fetch_channels(force_refresh)
+        if channel.category_id is None and channel.type == ChannelType.text
+    ]
+
+
+async def fetch_channel(
+        channel_id: int,
+        force_refresh: bool = False
+) -> VoiceChannel | TextChannel | CategoryChannel:
+    guild = guild_cache.get_guild()
+    if guild is not None and not force_refresh:
+        channel = guild.get_channel(channel_id)
+        if channel is not None:
+            guild_cache.record("fetch_channel", guild_cache.CACHE)
+            return channel
+
+    guild = guild or await fetch_guild()
+    guild_cache.record("fetch_channel", guild_cache.REST)
+    return await guild.fetch_channel(channel_id)
+
 
 async def fetch_message(channel_id: int, message_id: int) -> Message:
-    guild = await fetch_guild()
-    channel = await guild.fetch_channel(channel_id)
-    message = await channel.fetch_message(message_id)
-    return message
+    from backend.bot import bot
+
+    channel = await fetch_channel(channel_id)
+    message = bot.get_message(message_id)
+    if message is not None and message.channel.id == channel.id:
+        guild_cache.record("fetch_message", guild_cache.CACHE)
+        return message
+
+    guild_cache.record("fetch_message", guild_cache.REST)
+    return await channel.fetch_message(message_id)
 
 
 async def fetch_roles_with_access(category: CategoryChannel) -> list[Role]:
@@ -71,8 +181,16 @@ async def fetch_roles_with_access(category: CategoryChannel) -> list[Role]:
     ]
 
 
-async def fetch_user(user_id: int) -> Member:
-    guild = await fetch_guild()
+async def fetch_user(user_id: int, force_refresh: bool = False) -> Member:
+    guild = guild_cache.get_guild()
+    if guild is not None and not force_refresh:
+        member = guild.get_member(int(user_id))
+        if member is not None:
+            guild_cache.record("fetch_user", guild_cache.CACHE)
+            return member
+
+    guild = guild or await fetch_guild()
+    guild_cache.record("fetch_user", guild_cache.REST)
     return await guild.fetch_member(user_id)
 
 
@@ -84,37 +202,119 @@ async def fetch_user_roles_ids(user: Member) -> list[int]:
     return [role.id for role in user.roles]
 
 
-async def fetch_users() -> list[Member]:
-    guild = await fetch_guild()
-    members = await guild.fetch_members().flatten()
+async def fetch_users(force_refresh: bool = False) -> list[Member]:
+    guild = guild_cache.get_guild()
+    if guild is not None and guild.chunked and not force_refresh:
+        guild_cache.record("fetch_users", guild_cache.CACHE)
+        members = guild.members
+    else:
+        guild = guild or await fetch_guild()
+        guild_cache.record("fetch_users", guild_cache.REST)
+        members = await guild.fetch_members().flatten()
     return [member for member in members if member.bot is False]
 
 
-async def fetch_roles() -> list[Role]:
-    guild = await fetch_guild()
-    roles = await guild.fetch_roles()
-    return roles
+async def fetch_roles(force_refresh: bool = False) -> list[Role]:
+    guild = guild_cache.get_guild()
+    if guild is not None and guild.roles and not force_refresh:
+        guild_cache.record("fetch_roles", guild_cache.CACHE)
+        return list(guild.roles)
 
+    guild = guild or await fetch_guild()
+    guild_cache.record("fetch_roles", guild_cache.REST)
+    return await guild.fetch_roles()
 
-async def fetch_role(role_id: int) -> Role:
-    guild = await fetch_guild()
-    role = await guild.fetch_role(role_id)
-    return role
 
+async def fetch_role(role_id: int, force_refresh: bool = False) -> Role:
+    guild = guild_cache.get_guild()
+    if guild is not None and not force_refresh:
+        role = guild.get_role(role_id)
+        if role is not None:
+            guild_cache.record("fetch_role", guild_cache.CACHE)
+            return role
 
-async def fetch_users_with_role(role_id: int) -> list[Member]:
-    guild = await fetch_guild()
-    members = await guild.fetch_members().flatten()
-    role = await guild.fetch_role(role_id)
-    return [member for member in members if member.bot is False and role in member.roles]
+    guild = guild or await fetch_guild()
+    guild_cache.record("fetch_role", guild_cache.REST)
+    return await guild.fetch_role(role_id)
 
 
-async def fetch_users_by_ids(members: list) -> list[Member]:
-    guild = await fetch_guild()
-    return [
-        await guild.fetch_member(member_id)
-        for member_id in members
-    ]
+async def fetch_users_with_role(role_id: int, force_refresh: bool = False) -> list[Member]:
+    role = await fetch_role(role_id, force_refresh)
+
+    guild = guild_cache.get_guild()
+    if guild is not None and role_index.ready and not force_refresh:
+        guild_cache.record("fetch_users_with_role", guild_cache.CACHE)
+        members = (guild.get_member(member_id) for member_id in role_index.get_holders(role.id))
+        return [member for member in members if member is not None]
+
+    members = await fetch_users(force_refresh)
+    return [member for member in members if role in member.roles]
+
+
+async def fetch_users_by_ids(members: list) -> BatchFetchResult:
+    guild = guild_cache.get_guild()
+    get_cached = guild.get_member if guild is not None else None
+    return await _fetch_by_ids("fetch_users_by_ids", members, guild, get_cached, _fetch_remote_user)
+
+
+async def _fetch_remote_role(guild: Guild, role_id: int) -> Role:
+    return await guild.fetch_role(role_id)
+
+
+async def _fetch_remote_user(guild: Guild, user_id: int) -> Member:
+    return await guild.fetch_member(user_id)
+
+
+async def _fetch_by_ids(
+        call: str,
+        ids: list,
+        guild: Optional[Guild],
+        get_cached: Optional[Callable[[int], Optional[Role | Member]]],
+        fetch_remote: Callable[[Guild, int], Awaitable[Role | Member]]
+) -> BatchFetchResult:
+    result = BatchFetchResult()
+    resolved: dict[int, Role | Member] = {}
+    missing: list[int] = []
+    requested: dict[int, None] = {}
+
+    for raw_id in ids:
+        try:
+            object_id = int(raw_id)
+        except (TypeError, ValueError):
+            result.errors[str(raw_id)] = "Invalid id"
+            continue
+
+        if object_id in requested:
+            continue
+        requested[object_id] = None
+
+        cached = get_cached(object_id) if get_cached else None
+        if cached is not None:
+            guild_cache.record(call, guild_cache.CACHE)
+            resolved[object_id] = cached
+        else:
+            missing.append(object_id)
+
+    if missing and guild is None:
+        guild = await fetch_guild()
+    semaphore = asyncio.Semaphore(config.discord_fetch_concurrency)
+
+    async def fetch_one(object_id: int) -> Role | Member:
+        async with semaphore:
+            guild_cache.record(call, guild_cache.REST)
+            return await fetch_remote(guild, object_id)
+
+    fetched = await asyncio.gather(*(fetch_one(object_id) for object_id in missing), return_exceptions=True)
+    for object_id, value in zip(missing, fetched):
+        if isinstance(value, disnake.errors.HTTPException):
+            result.errors[str(object_id)] = str(value.text or value)
+        elif isinstance(value, BaseException):
+            raise value
+        else:
+            resolved[object_id] = value
+
+    result.found = [resolved[object_id] for object_id in requested if object_id in resolved]
+    return result
 
 
 async def fetch_guild_default_role() -> Role:
@@ -1,61 +1,52 @@
-import disnake
-from disnake import CategoryChannel, VoiceChannel, TextChannel, Member
+from collections import defaultdict
+from typing import Optional
+
+from disnake import CategoryChannel, ChannelType, VoiceChannel, TextChannel, Member, Role as DiscordRole
 
 from backend.config import config
-from backend.schemas import Channel, BaseChannel, Category, Role, User
+from backend.schemas import Channel, BaseChannel, Category, CategoryAccessMatrix, CategoryTree, GuildTree, Role, User
 from backend.services.fetch import (
-    fetch_channels,
+    fetch_categories,
+    fetch_category_channels,
+    fetch_text_channels_without_category,
     fetch_roles_with_access,
     fetch_guild_default_role,
     fetch_roles,
     fetch_users,
-    fetch_role,
     fetch_guild,
+    fetch_guild_snapshot,
 )
-from backend.utils.user import get_user_group
+from backend.services.member_index import member_index
+from backend.services.response_cache import cached_response, track_versions, ResponseCacheService
+from backend.utils.user import classify_user_groups, get_user_group
 
 
-async def format_categories_response() -> list[Category]:
+@cached_response(ResponseCacheService.CHANNELS)
+async def format_categories_response(force_refresh: bool = False) -> list[Category]:
     return [
         Category(
             id=str(channel.id),
             name=channel.name,
             position=channel.position,
         )
-        for channel in await fetch_channels()
-        if channel.type == disnake.ChannelType.category
+        for channel in await fetch_categories(force_refresh)
     ]
 
 
-async def format_channels_by_category_response(category: CategoryChannel) -> list[Channel]:
-    channels = [
-        Channel(
-            id=str(channel.id),
-            name=channel.name,
-            position=channel.position,
-            type=channel.type.name,
-        )
-        for channel in await fetch_channels()
-        if channel.category_id == category.id
-    ]
-    channels.sort(key=lambda channel: (channel.type != "text", channel.position))
-    return channels
+@cached_response(ResponseCacheService.CHANNELS)
+async def format_channels_by_category_response(
+        category: CategoryChannel,
+        force_refresh: bool = False
+) -> list[Channel]:
+    return _format_channels(await fetch_category_channels(category.id, force_refresh))
 
 
-async def format_text_channels_without_category_response() -> list[Channel]:
-    channels = [
-        Channel(
-            id=str(channel.id),
-            name=channel.name,
-            position=channel.position,
-            type=channel.type.name,
-        )
-        for channel in await fetch_channels()
-        if channel.category_id is None and channel.type == disnake.ChannelType.text
-    ]
-    return channels
+@cached_response(ResponseCacheService.CHANNELS)
+async def format_text_channels_without_category_response(force_refresh: bool = False) -> list[Channel]:
+    return _format_channels(await fetch_text_channels_without_category(force_refresh))
 
 
+@cached_response(ResponseCacheService.CHANNELS, ResponseCacheService.ROLES)
 async def format_roles_with_access_response(category: CategoryChannel) -> list[Role]:
     return [
         Role(
@@ -66,6 +57,25 @@ async def format_roles_with_access_response(category: CategoryChannel) -> list[R
     ]
 
 
+@cached_response(ResponseCacheService.CHANNELS, ResponseCacheService.ROLES)
+async def format_category_access_matrix_response(force_refresh: bool = False) -> CategoryAccessMatrix:
+    categories = await fetch_categories(force_refresh)
+    default_role = await fetch_guild_default_role()
+    roles = _format_non_editable_roles(await fetch_roles(force_refresh), default_role)
+
+    rows = {int(role.id): [False] * len(categories) for role in roles}
+    for column, category in enumerate(categories):
+        for target, permissions in category.overwrites.items():
+            if isinstance(target, DiscordRole) and permissions.view_channel is True and target.id in rows:
+                rows[target.id][column] = True
+
+    return CategoryAccessMatrix(
+        role_ids=[role.id for role in roles],
+        category_ids=[str(category.id) for category in categories],
+        matrix=list(rows.values()),
+    )
+
+
 async def format_roles_response(roles) -> list[Role]:
     default_role = await fetch_guild_default_role()
     return [
@@ -85,14 +95,19 @@ async def format_base_channel_response(channel: TextChannel | VoiceChannel, inde
     )
 
 
-async def format_non_editable_roles_response() -> list[Role]:
+@cached_response(ResponseCacheService.ROLES)
+async def format_non_editable_roles_response(force_refresh: bool = False) -> list[Role]:
     default_role = await fetch_guild_default_role()
+    return _format_non_editable_roles(await fetch_roles(force_refresh), default_role)
+
+
+def _format_non_editable_roles(guild_roles: list[DiscordRole], default_role: DiscordRole) -> list[Role]:
     roles = [
         Role(
             id=str(role.id),
             name=role.name
         )
-        for role in await fetch_roles()
+        for role in guild_roles
         if role != default_role and not role.is_bot_managed()
     ]
     roles = sorted(roles, key=lambda role: (
@@ -105,7 +120,8 @@ async def format_non_editable_roles_response() -> list[Role]:
     return roles
 
 
-async def format_editable_roles_response() -> list[Role]:
+@cached_response(ResponseCacheService.ROLES)
+async def format_editable_roles_response(force_refresh: bool = False) -> list[Role]:
     default_role = await fetch_guild_default_role()
     excluded_roles_ids = [
         default_role.id,
@@ -118,7 +134,7 @@ async def format_editable_roles_response() -> list[Role]:
             id=str(role.id),
             name=role.name
         )
-        for role in await fetch_roles()
+        for role in await fetch_roles(force_refresh)
         if (
             role.id not in excluded_roles_ids and not role.is_bot_managed()
         )
@@ -128,44 +144,127 @@ async def format_editable_roles_response() -> list[Role]:
     return roles
 
 
-async def format_users_response() -> list[User]:
+@cached_response(ResponseCacheService.USERS, ResponseCacheService.ROLES)
+async def format_users_response(force_refresh: bool = False) -> list[User]:
     guild = await fetch_guild()
-    users = []
-    for member in await fetch_users():
-        user_group, is_admin = await get_user_group(member, guild.owner_id)
-        users.append(
-            User(
-                id=str(member.id),
-                name=member.display_name,
-                group=user_group,
-                is_admin=is_admin
-            )
+    members = await fetch_users(force_refresh)
+    users = [
+        User(
+            id=str(member.id),
+            name=member.display_name,
+            group=user_group,
+            is_admin=is_admin
         )
+        for member, (user_group, is_admin) in zip(members, classify_user_groups(
+            members,
+            guild.owner_id,
+            use_role_index=not force_refresh
+        ))
+    ]
     users.sort(key=lambda user: user.name)
     return users
 
 
-async def format_base_users_response() -> list[User]:
-    filter_roles_ids = [
-        config.administrator_role_id,
-        config.teacher_role_id,
-        config.student_role_id,
+async def format_users_page_response(
+        offset: int = 0,
+        limit: Optional[int] = None,
+        search: Optional[str] = None,
+        group: Optional[str] = None,
+        role_id: Optional[int] = None,
+        descending: bool = False,
+) -> tuple[list[User], int]:
+    await track_versions(ResponseCacheService.USERS, ResponseCacheService.ROLES)
+    await _ensure_member_index()
+    return member_index.query(offset, limit, search, group, role_id, descending)
+
+
+async def format_users_search_response(query: str, limit: int) -> list[User]:
+    await track_versions(ResponseCacheService.USERS, ResponseCacheService.ROLES)
+    await _ensure_member_index()
+    return member_index.search(query, limit)
+
+
+async def _ensure_member_index() -> None:
+    if not member_index.ready:
+        guild = await fetch_guild()
+        member_index.build(guild.owner_id, await fetch_users())
+
+
+@cached_response(ResponseCacheService.USERS, ResponseCacheService.ROLES)
+async def format_base_users_response(force_refresh: bool = False) -> list[User]:
+    members = await fetch_users(force_refresh)
+    users = [
+        User(
+            id=str(member.id),
+            name=member.display_name
+        )
+        for member, (user_group, _) in zip(members, classify_user_groups(
+            members,
+            owner_id=None,
+            use_role_index=not force_refresh
+        ))
+        if user_group is not None
     ]
-    filter_roles = [
-        await fetch_role(role_id) for role_id in filter_roles_ids
+    users.sort(key=lambda user: user.name)
+    return users
+
+
+@cached_response(ResponseCacheService.CHANNELS, ResponseCacheService.ROLES, ResponseCacheService.USERS)
+async def format_guild_tree_response(force_refresh: bool = False) -> GuildTree:
+    snapshot = await fetch_guild_snapshot(force_refresh)
+
+    categories, channels_by_category = [], defaultdict(list)
+    for channel in sorted(snapshot.channels, key=lambda c: (c.position, c.id)):
+        if channel.type == ChannelType.category:
+            categories.append(channel)
+        else:
+            channels_by_category[channel.category_id].append(channel)
+    for channels in channels_by_category.values():
+        channels.sort(key=lambda channel: channel.type != ChannelType.text)
+
+    users = [
+        User(
+            id=str(member.id),
+            name=member.display_name
+        )
+        for member, (user_group, _) in zip(snapshot.members, classify_user_groups(
+            snapshot.members,
+            owner_id=None,
+            use_role_index=not force_refresh
+        ))
+        if user_group is not None
     ]
+    users.sort(key=lambda user: user.name)
 
-    users = []
-    for member in await fetch_users():
-        if any(role in filter_roles for role in member.roles):
-            users.append(
-                User(
-                    id=str(member.id),
-                    name=member.display_name
-                )
+    return GuildTree(
+        categories=[
+            CategoryTree(
+                id=str(category.id),
+                name=category.name,
+                position=category.position,
+                channels=_format_channels(channels_by_category[category.id]),
+                roles_with_access=[str(role.id) for role in await fetch_roles_with_access(category)],
             )
-    users.sort(key=lambda user: user.name)
-    return users
+            for category in categories
+        ],
+        channels_without_category=_format_channels(
+            [channel for channel in channels_by_category[None] if channel.type == ChannelType.text]
+        ),
+        roles=_format_non_editable_roles(snapshot.roles, snapshot.default_role),
+        users=users,
+    )
+
+
+def _format_channels(channels: list[TextChannel | VoiceChannel]) -> list[Channel]:
+    return [
+        Channel(
+            id=str(channel.id),
+            name=channel.name,
+            position=channel.position,
+            type=channel.type.name,
+        )
+        for channel in channels
+    ]
 
 
 async def format_user_response(user: Member) -> User:
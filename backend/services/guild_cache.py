@@ -0,0 +1,34 @@
+from collections import defaultdict
+from typing import Optional
+
+from disnake import Guild
+
+from backend.config import config, logger
+
+
+class GuildCacheService:
+    CACHE = "cache"
+    REST = "rest"
+
+    def __init__(self, guild_id: int):
+        self._guild_id = guild_id
+        self._sources: dict[str, dict[str, int]] = defaultdict(
+            lambda: {self.CACHE: 0, self.REST: 0}
+        )
+
+    def get_guild(self) -> Optional[Guild]:
+        from backend.bot import bot
+        guild = bot.get_guild(self._guild_id)
+        if guild is None or guild.unavailable:
+            return None
+        return guild
+
+    def record(self, call: str, source: str) -> None:
+        self._sources[call][source] += 1
+        logger.debug(f"{call} answered from {source}")
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        return {call: dict(sources) for call, sources in self._sources.items()}
+
+
+guild_cache = GuildCacheService(config.guild_id)
@@ -0,0 +1,99 @@
+import asyncio
+import datetime
+import gzip
+import json
+import os
+import re
+
+from backend.config import config, logger
+from backend.middlewares.supabase import ensure_logs_table
+from backend.schemas import LogArchiveSegment
+from backend.services.database import database
+
+
+class LogArchiveService:
+    SEGMENT_NAME_PATTERN = re.compile(r"^logs-\d+-\d+\.ndjson\.gz$")
+
+    def __init__(self, archive_path: str, retention_days: int, segment_size: int):
+        self._archive_path = archive_path
+        self._retention_days = retention_days
+        self._segment_size = segment_size
+
+    async def compact(self) -> int:
+        if self._retention_days <= 0:
+            return 0
+
+        await ensure_logs_table()
+        cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=self._retention_days)
+        archived = 0
+
+        while True:
+            async with database.acquire() as connection:
+                async with connection.transaction():
+                    rows = await connection.fetch(
+                        """
+                        SELECT id, user_name, action, event_time FROM logs
+                        WHERE event_time < $1
+                        ORDER BY event_time, id
+                        LIMIT $2
+                        FOR UPDATE
+                        """,
+                        cutoff,
+                        self._segment_size,
+                    )
+                    if not rows:
+                        break
+
+                    await asyncio.to_thread(self._write_segment, rows)
+                    await connection.execute("DELETE FROM logs WHERE id = ANY($1::integer[])", [row["id"] for row in rows])
+
+            archived += len(rows)
+            if len(rows) < self._segment_size:
+                break
+
+        if archived:
+            logger.info(f"Archived {archived} log entries older than {cutoff.isoformat()}")
+        return archived
+
+    def _write_segment(self, rows: list) -> None:
+        os.makedirs(self._archive_path, exist_ok=True)
+        path = os.path.join(self._archive_path, f"logs-{rows[0]['id']}-{rows[-1]['id']}.ndjson.gz")
+        temporary_path = f"{path}.tmp"
+
+        with gzip.open(temporary_path, "wt", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps({
+                    "id": row["id"],
+                    "user_name": row["user_name"],
+                    "action": row["action"],
+                    "event_time": row["event_time"].isoformat(),
+                }, ensure_ascii=False))
+                f.write("\n")
+        os.replace(temporary_path, path)
+
+    def list_segments(self) -> list[LogArchiveSegment]:
+        if not os.path.isdir(self._archive_path):
+            return []
+
+        segments = [
+            entry for entry in os.scandir(self._archive_path)
+            if self.SEGMENT_NAME_PATTERN.match(entry.name)
+        ]
+        segments.sort(key=lambda entry: int(entry.name.split("-")[1]))
+        return [
+            LogArchiveSegment(name=entry.name, size=entry.stat().st_size)
+            for entry in segments
+        ]
+
+    def get_segment_path(self, name: str) -> str:
+        path = os.path.join(self._archive_path, name)
+        if not self.SEGMENT_NAME_PATTERN.match(name) or not os.path.isfile(path):
+            raise FileNotFoundError("Archive segment not found")
+        return path
+
+
+log_archive = LogArchiveService(
+    os.path.join(config.data_path, "logs_archive"),
+    config.logs_retention_days,
+    config.logs_archive_segment_size,
+)
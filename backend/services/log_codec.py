@@ -0,0 +1,24 @@
+from typing import Iterable
+
+import msgpack
+
+from backend.schemas import LogSchema
+
+_packer = msgpack.Packer()
+
+
+def encode_log(log: LogSchema) -> bytes:
+    return _packer.pack((log.id, log.user_name, log.action, log.event_time))
+
+
+def decode_log(packed_log: bytes) -> LogSchema:
+    log_id, user_name, action, event_time = msgpack.unpackb(packed_log)
+    return LogSchema.model_construct(id=log_id, user_name=user_name, action=action, event_time=event_time)
+
+
+def pack_logs(packed_logs: list[bytes]) -> bytes:
+    return _packer.pack_array_header(len(packed_logs)) + b"".join(packed_logs)
+
+
+def encode_logs(logs: Iterable[LogSchema]) -> bytes:
+    return pack_logs([encode_log(log) for log in logs])
@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+from typing import AsyncIterator
+
+from backend.config import config, logger
+from backend.schemas import LogSchema
+from backend.services.supabase_client import stream_logs_from_supabase
+
+LOG_EXPORT_FIELDS = ["id", "user_name", "action", "event_time"]
+LOG_EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _encode_ndjson(logs: list[LogSchema], _: bool) -> str:
+    return "".join(json.dumps(log.model_dump(), ensure_ascii=False) + "\n" for log in logs)
+
+
+def _encode_csv(logs: list[LogSchema], include_header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=LOG_EXPORT_FIELDS)
+    if include_header:
+        writer.writeheader()
+    writer.writerows(log.model_dump() for log in logs)
+    return buffer.getvalue()
+
+
+_ENCODERS = {
+    "ndjson": _encode_ndjson,
+    "csv": _encode_csv,
+}
+
+
+async def open_logs_export(export_format: str, **filters) -> AsyncIterator[bytes]:
+    chunks = export_logs(export_format, **filters)
+    first_chunk = await anext(chunks)
+
+    async def stream() -> AsyncIterator[bytes]:
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    return stream()
+
+
+async def export_logs(export_format: str, **filters) -> AsyncIterator[bytes]:
+    encode = _ENCODERS[export_format]
+    chunk, include_header, exported = [], True, 0
+
+    try:
+        async for log in stream_logs_from_supabase(**filters):
+            chunk.append(log)
+            if len(chunk) >= config.logs_export_chunk_size:
+                yield encode(chunk, include_header).encode()
+                exported += len(chunk)
+                chunk, include_header = [], False
+
+        if chunk or include_header:
+            yield encode(chunk, include_header).encode()
+            exported += len(chunk)
+    except Exception as exception:
+        logger.error(f"Logs export aborted after {exported} entries: {exception}")
+        raise
+
+    logger.info(f"Exported {exported} log entries as {export_format}")
@@ -0,0 +1,130 @@
+import asyncio
+import datetime
+import time
+from typing import Optional
+
+from disnake import Member
+
+from backend.config import config, logger
+from backend.schemas import LogSchema
+from backend.services.cache import append_logs_to_cache, update_logs_cache
+from backend.services.supabase_client import save_logs_to_supabase
+
+
+class LogWriterService:
+    def __init__(self, max_queue_size: int, batch_size: int, flush_interval: float):
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue[LogSchema] = asyncio.Queue(maxsize=max_queue_size)
+        self._pending: list[LogSchema] = []
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self._cache_lock = asyncio.Lock()
+        self.flushed = 0
+        self.failed_flushes = 0
+        self.dropped = 0
+        self.last_flush_latency = 0.0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._stopping.set()
+        try:
+            await self._task
+        except Exception as error:
+            logger.error(f"Log writer stopped with an error: {error}")
+        self._task = None
+
+    async def rebuild_cache(self) -> None:
+        async with self._cache_lock:
+            await update_logs_cache()
+
+    def enqueue(self, user: Member, action: str) -> None:
+        try:
+            self._queue.put_nowait(
+                LogSchema(
+                    user_name=user.display_name,
+                    action=action,
+                    event_time=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                )
+            )
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.error(f"Log queue is full, dropped log entry: {action}")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if not self._pending:
+                    if self._stopping.is_set() and self._queue.empty():
+                        return
+                    await self._collect()
+                if self._pending and not await self._flush() and self._stopping.is_set():
+                    logger.error(f"Lost {len(self._pending) + self._queue.qsize()} log entries on shutdown")
+                    return
+            except Exception as error:
+                logger.error(f"Log writer iteration failed, retrying: {error}")
+                await asyncio.sleep(self._flush_interval)
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval
+        while len(self._pending) < self._batch_size:
+            if not self._queue.empty():
+                self._pending.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0 or self._stopping.is_set():
+                break
+            try:
+                self._pending.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+    async def _flush(self) -> bool:
+        batch = self._pending[:self._batch_size]
+        async with self._cache_lock:
+            started = time.perf_counter()
+            try:
+                saved_logs = await save_logs_to_supabase(batch)
+            except Exception as error:
+                saved_logs = None
+                self.failed_flushes += 1
+                logger.error(f"Failed to flush {len(batch)} log entries, will retry: {error}")
+            else:
+                del self._pending[:len(batch)]
+                self.flushed += len(batch)
+                self.last_flush_latency = time.perf_counter() - started
+                try:
+                    await append_logs_to_cache(saved_logs)
+                except Exception as error:
+                    logger.error(f"Failed to append {len(saved_logs)} log entries to cache: {error}")
+
+        if saved_logs is None:
+            if not self._stopping.is_set():
+                await asyncio.sleep(self._flush_interval)
+            return False
+        return True
+
+    def get_stats(self) -> dict[str, int | float]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "pending": len(self._pending),
+            "flushed": self.flushed,
+            "failed_flushes": self.failed_flushes,
+            "dropped": self.dropped,
+            "last_flush_latency_ms": self.last_flush_latency * 1000,
+        }
+
+
+log_writer = LogWriterService(
+    config.log_writer_max_queue_size,
+    config.log_writer_batch_size,
+    config.log_writer_flush_interval,
+)
@@ -0,0 +1,131 @@
+from bisect import bisect_left, insort
+from typing import Iterable, Optional
+
+from disnake import Member
+
+from backend.config import config
+from backend.schemas import User
+from backend.services.member_search import MemberSearchService
+from backend.utils.user import classify_user_group
+
+
+class MemberIndexService:
+    NO_GROUP = "none"
+
+    def __init__(self, guild_id: int):
+        self._guild_id = guild_id
+        self._owner_id: Optional[int] = None
+        self._users: dict[int, User] = {}
+        self._roles: dict[int, frozenset[int]] = {}
+        self._keys: dict[int, tuple[str, int]] = {}
+        self._ordering: list[tuple[str, int]] = []
+        self._group_ordering: dict[str, list[tuple[str, int]]] = {}
+        self._search = MemberSearchService()
+        self.ready = False
+
+    def build(self, owner_id: int, members: Iterable[Member]) -> None:
+        self._owner_id = owner_id
+        self._users.clear()
+        self._roles.clear()
+        self._keys.clear()
+        self._ordering.clear()
+        self._group_ordering.clear()
+        for member in members:
+            if member.guild.id != self._guild_id or member.bot:
+                continue
+
+            user = self._create_user(member)
+            key = (user.name, member.id)
+            self._users[member.id] = user
+            self._keys[member.id] = key
+            self._ordering.append(key)
+            self._group_ordering.setdefault(self._get_group_key(user), []).append(key)
+
+        self._ordering.sort()
+        for ordering in self._group_ordering.values():
+            ordering.sort()
+        self._search.build((member_id, user.name) for member_id, user in self._users.items())
+        self.ready = True
+
+    def invalidate(self) -> None:
+        self.ready = False
+
+    def upsert(self, member: Member) -> None:
+        if member.guild.id != self._guild_id or member.bot:
+            return
+
+        user = self._create_user(member)
+        if self._users.get(member.id) == user:
+            return
+
+        self.remove(member.id, keep_roles=True)
+        key = (user.name, member.id)
+        self._users[member.id] = user
+        self._keys[member.id] = key
+        insort(self._ordering, key)
+        insort(self._group_ordering.setdefault(self._get_group_key(user), []), key)
+        self._search.upsert(member.id, user.name)
+
+    def remove(self, member_id: int, keep_roles: bool = False) -> None:
+        if not keep_roles:
+            self._roles.pop(member_id, None)
+        key = self._keys.pop(member_id, None)
+        if key is None:
+            return
+
+        user = self._users.pop(member_id)
+        self._discard(self._ordering, key)
+        self._discard(self._group_ordering[self._get_group_key(user)], key)
+        self._search.remove(member_id)
+
+    def update_owner(self, owner_id: int, members: Iterable[Member]) -> None:
+        self._owner_id = owner_id
+        for member in members:
+            self.upsert(member)
+
+    def query(
+            self,
+            offset: int = 0,
+            limit: Optional[int] = None,
+            search: Optional[str] = None,
+            group: Optional[str] = None,
+            role_id: Optional[int] = None,
+            descending: bool = False,
+    ) -> tuple[list[User], int]:
+        ordering = self._ordering if group is None else self._group_ordering.get(group, [])
+        if role_id is not None:
+            ordering = [key for key in ordering if role_id in self._roles[key[1]]]
+        if search:
+            matches = self._search.match(search)
+            ordering = [key for key in ordering if key[1] in matches]
+
+        total = len(ordering)
+        if descending:
+            end = max(total - offset, 0)
+            start = max(end - limit, 0) if limit else 0
+            keys = ordering[start:end][::-1]
+        else:
+            keys = ordering[offset:offset + limit] if limit else ordering[offset:]
+
+        return [self._users[member_id] for _, member_id in keys], total
+
+    def search(self, query: str, limit: int) -> list[User]:
+        return [self._users[member_id] for member_id in self._search.search(query, limit)]
+
+    def _create_user(self, member: Member) -> User:
+        roles_ids = frozenset(role.id for role in member.roles)
+        self._roles[member.id] = roles_ids
+        group, is_admin = classify_user_group(roles_ids, member.id, self._owner_id)
+        return User(id=str(member.id), name=member.display_name, group=group, is_admin=is_admin)
+
+    def _get_group_key(self, user: User) -> str:
+        return user.group or self.NO_GROUP
+
+    @staticmethod
+    def _discard(ordering: list[tuple[str, int]], key: tuple[str, int]) -> None:
+        index = bisect_left(ordering, key)
+        if index < len(ordering) and ordering[index] == key:
+            del ordering[index]
+
+
+member_index = MemberIndexService(config.guild_id)
@@ -0,0 +1,120 @@
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Iterable, Optional
+
+
+class MemberSearchService:
+    TRIGRAM_SIZE = 3
+    APOSTROPHES = str.maketrans("", "", "'\u02bc\u2019\u02b9`")
+
+    def __init__(self):
+        self._names: dict[int, str] = {}
+        self._words: list[tuple[str, int]] = []
+        self._trigrams: dict[str, set[int]] = {}
+
+    @classmethod
+    def normalize(cls, text: str) -> str:
+        decomposed = unicodedata.normalize("NFKD", text.casefold().translate(cls.APOSTROPHES))
+        stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+        return " ".join(re.sub(r"[^\w\s]", "", stripped).split())
+
+    @classmethod
+    def _get_trigrams(cls, text: str) -> set[str]:
+        return {text[index:index + cls.TRIGRAM_SIZE] for index in range(len(text) - cls.TRIGRAM_SIZE + 1)}
+
+    def clear(self) -> None:
+        self._names.clear()
+        self._words.clear()
+        self._trigrams.clear()
+
+    def build(self, names: Iterable[tuple[int, str]]) -> None:
+        self.clear()
+        for member_id, name in names:
+            normalized_name = self.normalize(name)
+            self._names[member_id] = normalized_name
+            self._words.extend((word, member_id) for word in set(normalized_name.split()))
+            for trigram in self._get_trigrams(normalized_name):
+                self._trigrams.setdefault(trigram, set()).add(member_id)
+        self._words.sort()
+
+    def upsert(self, member_id: int, name: str) -> None:
+        normalized_name = self.normalize(name)
+        if self._names.get(member_id) == normalized_name:
+            return
+
+        self.remove(member_id)
+        self._names[member_id] = normalized_name
+        for word in set(normalized_name.split()):
+            insort(self._words, (word, member_id))
+        for trigram in self._get_trigrams(normalized_name):
+            self._trigrams.setdefault(trigram, set()).add(member_id)
+
+    def remove(self, member_id: int) -> None:
+        normalized_name = self._names.pop(member_id, None)
+        if normalized_name is None:
+            return
+
+        for word in set(normalized_name.split()):
+            index = bisect_left(self._words, (word, member_id))
+            if index < len(self._words) and self._words[index] == (word, member_id):
+                del self._words[index]
+        for trigram in self._get_trigrams(normalized_name):
+            members_ids = self._trigrams.get(trigram)
+            if members_ids is not None:
+                members_ids.discard(member_id)
+                if not members_ids:
+                    del self._trigrams[trigram]
+
+    def match(self, query: str) -> set[int]:
+        words = self.normalize(query).split()
+        if not words:
+            return set()
+
+        matches = None
+        for word in sorted(words, key=len, reverse=True):
+            word_matches = self._match_word(word)
+            matches = word_matches if matches is None else matches & word_matches
+            if not matches:
+                break
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[int]:
+        needle = self.normalize(query)
+        matches = self.match(needle)
+
+        def rank(member_id: int) -> tuple[int, str, int]:
+            name = self._names[member_id]
+            if name == needle:
+                score = 0
+            elif name.startswith(needle):
+                score = 1
+            elif f" {needle}" in f" {name}":
+                score = 2
+            else:
+                score = 3
+            return score, name, member_id
+
+        if limit is None:
+            return sorted(matches, key=rank)
+        return heapq.nsmallest(limit, matches, key=rank)
+
+    def _match_word(self, word: str) -> set[int]:
+        if len(word) < self.TRIGRAM_SIZE:
+            return self._match_prefix(word)
+
+        postings = sorted(
+            (self._trigrams.get(trigram, set()) for trigram in self._get_trigrams(word)),
+            key=len
+        )
+        candidates = set.intersection(*postings)
+        return {member_id for member_id in candidates if word in self._names[member_id]}
+
+    def _match_prefix(self, prefix: str) -> set[int]:
+        matches = set()
+        index = bisect_left(self._words, (prefix,))
+        while index < len(self._words) and self._words[index][0].startswith(prefix):
+            matches.add(self._words[index][1])
+            index += 1
+        return matches
@@ -0,0 +1,87 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+import disnake
+from disnake import CategoryChannel, Member, PermissionOverwrite, Role
+
+from backend.config import config
+
+
+@dataclass
+class PermissionSyncPlan:
+    category: CategoryChannel
+    overwrites: Optional[dict[Role | Member, PermissionOverwrite]]
+
+
+@dataclass
+class PermissionSyncResult:
+    discord_calls: int = 0
+    skipped: int = 0
+    failures: dict[int, disnake.errors.HTTPException] = field(default_factory=dict)
+
+    def as_meta(self) -> dict:
+        return {
+            "discord_calls": self.discord_calls,
+            "skipped": self.skipped,
+            "errors": {
+                str(category_id): str(exception.text or exception)
+                for category_id, exception in self.failures.items()
+            },
+        }
+
+
+def default_category_overwrite() -> PermissionOverwrite:
+    return PermissionOverwrite(
+        view_channel=False,
+        create_instant_invite=False,
+        read_message_history=True,
+    )
+
+
+def plan_category_access(
+        category: CategoryChannel,
+        default_role: Role,
+        roles_with_access: Iterable[Role]
+) -> PermissionSyncPlan:
+    current_overwrites = category.overwrites
+    access = {role.id: role for role in roles_with_access if role != default_role}
+
+    overwrites = {
+        target: overwrite
+        for target, overwrite in current_overwrites.items()
+        if not (isinstance(target, Role) and overwrite.view_channel is True and target.id not in access)
+    }
+    overwrites[default_role] = default_category_overwrite()
+    for role in access.values():
+        overwrite = current_overwrites.get(role)
+        if overwrite is None or overwrite.view_channel is not True:
+            overwrite = PermissionOverwrite.from_pair(*(overwrite or PermissionOverwrite()).pair())
+            overwrite.update(view_channel=True)
+        overwrites[role] = overwrite
+
+    if overwrites == current_overwrites:
+        return PermissionSyncPlan(category=category, overwrites=None)
+    return PermissionSyncPlan(category=category, overwrites=overwrites)
+
+
+async def apply_permission_plans(plans: list[PermissionSyncPlan]) -> PermissionSyncResult:
+    result = PermissionSyncResult()
+    pending = [plan for plan in plans if plan.overwrites is not None]
+    result.skipped = len(plans) - len(pending)
+
+    semaphore = asyncio.Semaphore(config.discord_edit_concurrency)
+
+    async def apply(plan: PermissionSyncPlan) -> None:
+        async with semaphore:
+            result.discord_calls += 1
+            await plan.category.edit(overwrites=plan.overwrites)
+
+    outcomes = await asyncio.gather(*(apply(plan) for plan in pending), return_exceptions=True)
+    for plan, outcome in zip(pending, outcomes):
+        if isinstance(outcome, disnake.errors.HTTPException):
+            result.failures[plan.category.id] = outcome
+        elif isinstance(outcome, BaseException):
+            raise outcome
+
+    return result
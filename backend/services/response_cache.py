@@ -0,0 +1,179 @@
+import asyncio
+import inspect
+import secrets
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Hashable, Optional, get_type_hints
+
+import redis.exceptions as exceptions
+from pydantic import TypeAdapter
+
+from backend.config import config, logger
+from backend.services.cache import redis_client
+
+served_versions: ContextVar[Optional[dict[str, int]]] = ContextVar("served_versions", default=None)
+
+
+class ResponseCacheService:
+    CHANNELS = "channels"
+    ROLES = "roles"
+    USERS = "users"
+    SETTINGS = "settings"
+    EPOCH = "epoch"
+
+    def __init__(self, ttl: int, redis_backed: bool):
+        self._ttl = ttl
+        self._redis_backed = redis_backed
+        self._versions: dict[str, int] = defaultdict(int)
+        self._versions[self.EPOCH] = secrets.randbits(48)
+        self._entries: dict[str, tuple[float, tuple[int, ...], Any]] = {}
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.coalesced = 0
+
+    async def get_versions(self, tags: tuple[str, ...]) -> Optional[tuple[int, ...]]:
+        if not self._redis_backed:
+            return tuple(self._versions[tag] for tag in tags)
+
+        try:
+            async with redis_client.pipeline(transaction=True) as pipeline:
+                pipeline.hsetnx(config.redis_response_versions_key, self.EPOCH, secrets.randbits(48))
+                pipeline.hmget(config.redis_response_versions_key, tags)
+                _, versions = await pipeline.execute()
+            return tuple(int(version or 0) for version in versions)
+        except exceptions.ConnectionError as error:
+            logger.error(f"Redis connection error: {error}, bypassing response cache")
+            return None
+
+    async def get(self, key: str, versions: tuple[int, ...], adapter: TypeAdapter) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.time() and entry[1] == versions:
+            self.hits += 1
+            return entry[2]
+
+        if self._redis_backed:
+            try:
+                cached_value = await redis_client.get(self._get_redis_key(key, versions))
+                if cached_value is not None:
+                    value = adapter.validate_json(cached_value)
+                    self._entries[key] = (time.time() + self._ttl, versions, value)
+                    self.redis_hits += 1
+                    return value
+            except exceptions.ConnectionError as error:
+                logger.error(f"Redis connection error: {error}")
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, versions: tuple[int, ...], value: Any, adapter: TypeAdapter) -> None:
+        self._entries[key] = (time.time() + self._ttl, versions, value)
+
+        if self._redis_backed:
+            try:
+                await redis_client.set(self._get_redis_key(key, versions), adapter.dump_json(value), ex=self._ttl)
+            except exceptions.ConnectionError as error:
+                logger.error(f"Redis connection error: {error}")
+
+    async def invalidate(self, *tags: str) -> None:
+        self.invalidations += 1
+        for tag in tags:
+            self._versions[tag] += 1
+
+        if self._redis_backed:
+            try:
+                async with redis_client.pipeline(transaction=True) as pipeline:
+                    for tag in tags:
+                        pipeline.hincrby(config.redis_response_versions_key, tag, 1)
+                    await pipeline.execute()
+            except exceptions.ConnectionError as error:
+                logger.error(f"Redis connection error: {error}")
+
+    def get_etag(self, versions: dict[str, int]) -> str:
+        tags = ".".join(f"{tag}{version}" for tag, version in sorted(versions.items()))
+        return f'W/"{tags}"'
+
+    async def coalesce(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(in_flight)
+
+        in_flight = asyncio.ensure_future(factory())
+        self._in_flight[key] = in_flight
+        in_flight.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(in_flight)
+
+    @staticmethod
+    def _get_redis_key(key: str, versions: tuple[int, ...]) -> str:
+        return f"{config.redis_response_cache_prefix}:{key}:{'.'.join(map(str, versions))}"
+
+    def get_stats(self) -> dict[str, int | bool]:
+        return {
+            "size": len(self._entries),
+            "redis_backed": self._redis_backed,
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "in_flight": len(self._in_flight),
+            "coalesced": self.coalesced,
+        }
+
+
+response_cache = ResponseCacheService(config.response_cache_ttl, config.response_cache_redis)
+
+
+async def track_versions(*tags: str) -> Optional[tuple[int, ...]]:
+    tags = (ResponseCacheService.EPOCH, *tags)
+    versions = await response_cache.get_versions(tags)
+    served = served_versions.get()
+    if served is not None and versions is not None:
+        served.update(zip(tags, versions))
+    return versions
+
+
+def _get_argument_key(value: Any) -> str:
+    return str(getattr(value, "id", value))
+
+
+def cached_response(*tags: str):
+    def decorator(func):
+        adapter = TypeAdapter(get_type_hints(func)["return"])
+        accepts_force_refresh = "force_refresh" in inspect.signature(func).parameters
+
+        @wraps(func)
+        async def wrapper(*args, force_refresh: bool = False, **kwargs):
+            if force_refresh:
+                await response_cache.invalidate(*tags)
+
+            key = ":".join([
+                func.__name__,
+                *(_get_argument_key(arg) for arg in args),
+                *(f"{name}={_get_argument_key(value)}" for name, value in sorted(kwargs.items())),
+            ])
+            versions = await track_versions(*tags)
+
+            if versions is not None and not force_refresh:
+                cached_value = await response_cache.get(key, versions, adapter)
+                if cached_value is not None:
+                    return cached_value
+
+            async def compute():
+                if accepts_force_refresh:
+                    kwargs["force_refresh"] = force_refresh
+                value = await func(*args, **kwargs)
+
+                if versions is not None:
+                    await response_cache.set(key, versions, value, adapter)
+                return value
+
+            return await response_cache.coalesce((key, versions, force_refresh), compute)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,52 @@
+from typing import Container
+
+from disnake import Guild, Member
+
+from backend.config import config
+
+
+class RoleIndexService:
+    def __init__(self, guild_id: int):
+        self._guild_id = guild_id
+        self._holders: dict[int, dict[int, None]] = {}
+        self._member_roles: dict[int, frozenset[int]] = {}
+        self.ready = False
+
+    def build(self, guild: Guild) -> None:
+        self._holders.clear()
+        self._member_roles.clear()
+        for member in guild.members:
+            self.upsert(member)
+        self.ready = guild.chunked
+
+    def upsert(self, member: Member) -> None:
+        if member.guild.id != self._guild_id or member.bot:
+            return
+
+        roles_ids = frozenset(role.id for role in member.roles)
+        previous_roles_ids = self._member_roles.get(member.id, frozenset())
+        if roles_ids == previous_roles_ids and member.id in self._member_roles:
+            return
+
+        for role_id in previous_roles_ids - roles_ids:
+            self._holders.get(role_id, {}).pop(member.id, None)
+        for role_id in roles_ids - previous_roles_ids:
+            self._holders.setdefault(role_id, {})[member.id] = None
+        self._member_roles[member.id] = roles_ids
+
+    def remove(self, member_id: int) -> None:
+        for role_id in self._member_roles.pop(member_id, frozenset()):
+            self._holders.get(role_id, {}).pop(member_id, None)
+
+    def remove_role(self, role_id: int) -> None:
+        for member_id in self._holders.pop(role_id, {}):
+            self._member_roles[member_id] = self._member_roles[member_id] - {role_id}
+
+    def get_holders(self, role_id: int) -> list[int]:
+        return list(self._holders.get(role_id, {}))
+
+    def get_holders_view(self, role_id: int) -> Container[int]:
+        return self._holders.get(role_id, {})
+
+
+role_index = RoleIndexService(config.guild_id)
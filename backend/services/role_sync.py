@@ -0,0 +1,73 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+import disnake
+from disnake import Member, Role
+
+from backend.config import config
+
+
+@dataclass
+class RoleSyncPlan:
+    member: Member
+    roles: Optional[list[Role]]
+
+
+@dataclass
+class RoleSyncResult:
+    discord_calls: int = 0
+    skipped: int = 0
+    failures: dict[int, disnake.errors.HTTPException] = field(default_factory=dict)
+
+    def as_meta(self) -> dict:
+        return {
+            "discord_calls": self.discord_calls,
+            "skipped": self.skipped,
+            "errors": {
+                str(member_id): str(exception.text or exception)
+                for member_id, exception in self.failures.items()
+            },
+        }
+
+
+def plan_member_roles(
+        member: Member,
+        add: Iterable[Role] = (),
+        remove: Iterable[Role] = ()
+) -> RoleSyncPlan:
+    current_roles = {role.id: role for role in member.roles if not role.is_default()}
+    target_roles = dict(current_roles)
+
+    for role in remove:
+        if not role.managed:
+            target_roles.pop(role.id, None)
+    for role in add:
+        if not role.is_default():
+            target_roles[role.id] = role
+
+    if target_roles.keys() == current_roles.keys():
+        return RoleSyncPlan(member=member, roles=None)
+    return RoleSyncPlan(member=member, roles=list(target_roles.values()))
+
+
+async def apply_role_plans(plans: list[RoleSyncPlan]) -> RoleSyncResult:
+    result = RoleSyncResult()
+    pending = [plan for plan in plans if plan.roles is not None]
+    result.skipped = len(plans) - len(pending)
+
+    semaphore = asyncio.Semaphore(config.discord_edit_concurrency)
+
+    async def apply(plan: RoleSyncPlan) -> None:
+        async with semaphore:
+            result.discord_calls += 1
+            await plan.member.edit(roles=plan.roles)
+
+    outcomes = await asyncio.gather(*(apply(plan) for plan in pending), return_exceptions=True)
+    for plan, outcome in zip(pending, outcomes):
+        if isinstance(outcome, disnake.errors.HTTPException):
+            result.failures[plan.member.id] = outcome
+        elif isinstance(outcome, BaseException):
+            raise outcome
+
+    return result
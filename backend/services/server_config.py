@@ -14,6 +14,7 @@ from backend.schemas import (
     StaffConfigInfoExtended
 )
 from backend.services.fetch import fetch_channel
+from backend.services.response_cache import response_cache, track_versions, ResponseCacheService
 from backend.utils.channels import check_channel_in_category
 from backend.utils.validation import check_message_in_channel
 
@@ -55,6 +56,7 @@ class ServerConfigService:
         return config.language
 
     async def get_validated_config(self) -> ServerConfig:
+        await track_versions(ResponseCacheService.SETTINGS, ResponseCacheService.CHANNELS)
         original_config = await self.get_config()
         validated_config = original_config.model_copy(deep=True)
 
@@ -148,6 +150,7 @@ class ServerConfigService:
         with open(self._server_config_path, "w", encoding="utf-8") as f:
             json.dump(new_config.model_dump(), f, indent=2)
         self._server_config = new_config
+        await response_cache.invalidate(ResponseCacheService.SETTINGS)
 
 
 print(config.data_path)
@@ -1,44 +1,144 @@
 import datetime
+from typing import AsyncIterator, Optional
 
-import postgrest
-from disnake import Member
+import asyncpg
 from fastapi import HTTPException
 from supabase import create_client, Client
 
 from backend.config import config
-from backend.middlewares.supabase import logs_table_exists
+from backend.middlewares.supabase import ensure_logs_table, logs_table_exists
 from backend.schemas import LogSchema
+from backend.services.database import database
 
 supabase: Client = create_client(config.supabase_url, config.supabase_key)
 
 
+def _row_to_log(row: asyncpg.Record) -> LogSchema:
+    return LogSchema(
+        id=row["id"],
+        user_name=row["user_name"],
+        action=row["action"],
+        event_time=row["event_time"].isoformat(),
+    )
+
+
 @logs_table_exists
-async def save_log_to_supabase(user: Member, action: str) -> None:
+async def save_logs_to_supabase(logs: list[LogSchema]) -> list[LogSchema]:
     try:
-        name = user.display_name
-        timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
-
-        log_data = {
-            "user_name": name,
-            "action": action,
-            "event_time": timestamp,
-        }
-        supabase.table("logs").insert(log_data).execute()
+        async with database.acquire() as connection:
+            rows = await connection.fetch(
+                """
+                INSERT INTO logs (user_name, action, event_time)
+                SELECT * FROM unnest($1::text[], $2::text[], $3::timestamptz[])
+                RETURNING id, user_name, action, event_time
+                """,
+                [log.user_name for log in logs],
+                [log.action for log in logs],
+                [datetime.datetime.fromisoformat(log.event_time) for log in logs],
+            )
+        return [_row_to_log(row) for row in rows]
 
-    except postgrest.exceptions.APIError as e:
+    except asyncpg.PostgresError as e:
         raise HTTPException(detail=f"Error during Supabase logging: {e}", status_code=500)
 
 
+def _build_logs_filter(
+        arguments: list,
+        cursor: Optional[tuple[datetime.datetime, int]] = None,
+        user_name: Optional[str] = None,
+        action: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+) -> str:
+    conditions = []
+
+    def add_condition(sql: str, *values) -> None:
+        placeholders = [f"${len(arguments) + index}" for index in range(1, len(values) + 1)]
+        conditions.append(sql.format(*placeholders))
+        arguments.extend(values)
+
+    if cursor:
+        add_condition("(event_time, id) < ({}::timestamptz, {}::integer)", *cursor)
+    if user_name:
+        add_condition("user_name = {}", user_name)
+    if action:
+        escaped_action = action.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        add_condition("action ILIKE '%' || {}::text || '%'", escaped_action)
+    if start_time:
+        add_condition("event_time >= {}::timestamptz", start_time)
+    if end_time:
+        add_condition("event_time <= {}::timestamptz", end_time)
+
+    return f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+
 @logs_table_exists
-async def read_logs_from_supabase() -> list[LogSchema]:
+async def read_logs_page_from_supabase(
+        limit: int,
+        cursor: Optional[tuple[datetime.datetime, int]] = None,
+        user_name: Optional[str] = None,
+        action: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+) -> list[LogSchema]:
+    arguments = []
+    where = _build_logs_filter(arguments, cursor, user_name, action, start_time, end_time)
+    arguments.append(limit)
+
     try:
-        response = (
-            supabase
-            .table("logs")
-            .select("*")
-            .execute()
-        )
-        return [LogSchema(**log) for log in response.data[::-1]]
-
-    except postgrest.exceptions.APIError as e:
+        async with database.acquire() as connection:
+            rows = await connection.fetch(
+                f"""
+                SELECT id, user_name, action, event_time FROM logs
+                {where}
+                ORDER BY event_time DESC, id DESC
+                LIMIT ${len(arguments)}
+                """,
+                *arguments,
+            )
+        return [_row_to_log(row) for row in rows]
+
+    except asyncpg.PostgresError as e:
+        raise HTTPException(detail=f"Error during reading Supabase logs: {e}", status_code=500)
+
+
+async def stream_logs_from_supabase(
+        user_name: Optional[str] = None,
+        action: Optional[str] = None,
+        start_time: Optional[datetime.datetime] = None,
+        end_time: Optional[datetime.datetime] = None,
+) -> AsyncIterator[LogSchema]:
+    await ensure_logs_table()
+    arguments = []
+    where = _build_logs_filter(arguments, None, user_name, action, start_time, end_time)
+
+    async with database.acquire() as connection:
+        async with connection.transaction(readonly=True):
+            async for row in connection.cursor(
+                    f"""
+                    SELECT id, user_name, action, event_time FROM logs
+                    {where}
+                    ORDER BY event_time DESC, id DESC
+                    """,
+                    *arguments,
+                    prefetch=config.logs_export_chunk_size,
+            ):
+                yield _row_to_log(row)
+
+
+@logs_table_exists
+async def read_logs_from_supabase(limit: Optional[int] = None) -> list[LogSchema]:
+    try:
+        async with database.acquire() as connection:
+            rows = await connection.fetch(
+                """
+                SELECT id, user_name, action, event_time FROM logs
+                ORDER BY event_time DESC, id DESC
+                LIMIT $1
+                """,
+                limit,
+            )
+        return [_row_to_log(row) for row in rows]
+
+    except asyncpg.PostgresError as e:
         raise HTTPException(detail=f"Error during reading Supabase logs: {e}", status_code=500)
@@ -1,7 +1,10 @@
+from typing import Collection, Iterable, Optional
+
 from disnake import Member
 
 from backend.config import config
-from backend.services.fetch import fetch_guild, fetch_user_roles_ids
+from backend.services.fetch import fetch_guild
+from backend.services.role_index import role_index
 
 
 async def rename_target_user(user: Member, name: str) -> Member:
@@ -13,16 +16,58 @@ async def kick_target_user(user: Member) -> None:
     await guild.kick(user)
 
 
+STAFF_ADMINISTRATOR_GROUP = ("staff", True)
+STAFF_GROUP = ("staff", False)
+STUDENT_GROUP = ("student", False)
+NO_GROUP = (None, False)
+
+GROUP_RULES = (
+    (config.administrator_role_id, STAFF_ADMINISTRATOR_GROUP),
+    (config.teacher_role_id, STAFF_GROUP),
+    (config.student_role_id, STUDENT_GROUP),
+)
+
+
 async def get_user_group(user: Member, owner_id: int = None) -> tuple[str | None, bool]:
     if not owner_id:
         guild = await fetch_guild()
         owner_id = guild.owner_id
 
-    roles_ids = await fetch_user_roles_ids(user)
-    if config.administrator_role_id in roles_ids or user.id == owner_id:
-        return "staff", True
-    elif config.teacher_role_id in roles_ids:
-        return "staff", False
-    elif config.student_role_id in roles_ids:
-        return "student", False
-    return None, False
+    return classify_user_groups([user], owner_id)[0]
+
+
+def classify_user_group(roles_ids: Collection[int], user_id: int, owner_id: int) -> tuple[str | None, bool]:
+    if user_id == owner_id:
+        return STAFF_ADMINISTRATOR_GROUP
+    for role_id, group in GROUP_RULES:
+        if role_id in roles_ids:
+            return group
+    return NO_GROUP
+
+
+def classify_user_groups(
+        users: Iterable[Member],
+        owner_id: Optional[int],
+        use_role_index: bool = False
+) -> list[tuple[str | None, bool]]:
+    if use_role_index and role_index.ready:
+        holders = {role_id: role_index.get_holders_view(role_id) for role_id, _ in GROUP_RULES}
+
+        def has_role(user: Member, role_id: int) -> bool:
+            return user.id in holders[role_id]
+    else:
+        def has_role(user: Member, role_id: int) -> bool:
+            return user.get_role(role_id) is not None
+
+    groups = []
+    for user in users:
+        if user.id == owner_id:
+            groups.append(STAFF_ADMINISTRATOR_GROUP)
+            continue
+        for role_id, group in GROUP_RULES:
+            if has_role(user, role_id):
+                groups.append(group)
+                break
+        else:
+            groups.append(NO_GROUP)
+    return groups
@@ -1,5 +1,17 @@
 import axios, {AxiosError, AxiosResponse, InternalAxiosRequestConfig} from 'axios';
-import {Category, Channel, Log, Queue, NameRequest, ReorderRequest, Role, User, ServerConfig} from "@/lib/types.ts";
+import {
+	Bootstrap,
+	Category,
+	CategoryAccessMatrix,
+	Channel,
+	Log,
+	Queue,
+	NameRequest,
+	ReorderRequest,
+	Role,
+	User,
+	ServerConfig
+} from "@/lib/types.ts";
 import {supabase} from "@/lib/supabaseClient";
 
 if (!import.meta.env.VITE_API_URL) {
@@ -54,12 +66,17 @@ interface ApiResponse<T> {
 	data: T;
 	success: boolean;
 	error: string | null;
+	meta?: Record<string, unknown> | null;
 }
 
 async function handleRequest<T>(apiCall: Promise<AxiosResponse<ApiResponse<T>>>): Promise<T> {
+	return (await handleResponse(apiCall)).data;
+}
+
+async function handleResponse<T>(apiCall: Promise<AxiosResponse<ApiResponse<T>>>): Promise<ApiResponse<T>> {
 	try {
 		const response = await apiCall;
-		return response.data.data;
+		return response.data;
 	} catch (error) {
 		if (axios.isAxiosError(error)) {
 			const axiosError = error as AxiosError;
@@ -74,6 +91,10 @@ async function handleRequest<T>(apiCall: Promise<AxiosResponse<ApiResponse<T>>>)
 }
 
 
+export async function getBootstrap(): Promise<Bootstrap> {
+	return handleRequest(api.get<ApiResponse<Bootstrap>>('/api/v1/bootstrap'));
+}
+
 export async function getCategories(): Promise<Category[]> {
 	return handleRequest(api.get<ApiResponse<Category[]>>('/api/v1/categories'));
 }
@@ -160,6 +181,18 @@ export async function renameCategory(categoryId: string, name: string): Promise<
 	}));
 }
 
+export async function getCategoryAccessMatrix(): Promise<CategoryAccessMatrix> {
+	return handleRequest(api.get<ApiResponse<CategoryAccessMatrix>>(`/api/v1/categories/permissions`));
+}
+
+export async function editCategoryAccessMatrix(accessMatrix: CategoryAccessMatrix): Promise<CategoryAccessMatrix> {
+	return handleRequest(api.put<ApiResponse<CategoryAccessMatrix>>(`/api/v1/categories/permissions`, accessMatrix, {
+		headers: {
+			'X-Request-Source-Method': 'category.permissions.edit'
+		}
+	}));
+}
+
 export async function getCategoryAccessRoles(categoryId: string): Promise<Role[]> {
 	return handleRequest(api.get<ApiResponse<Role[]>>(`/api/v1/categories/${categoryId}/permissions`));
 }
@@ -215,6 +248,12 @@ export async function getBaseUsers(): Promise<User[]> {
 	return handleRequest(api.get<ApiResponse<User[]>>(`/api/v1/users/base`));
 }
 
+export async function searchUsers(query: string, limit: number = 20): Promise<User[]> {
+	return handleRequest(api.get<ApiResponse<User[]>>(`/api/v1/users/search`, {
+		params: {q: query, limit}
+	}));
+}
+
 export async function getRoleHolders(roleId: string): Promise<User[]> {
 	return handleRequest(api.get<ApiResponse<User[]>>(`/api/v1/roles/${roleId}`));
 }
@@ -260,8 +299,15 @@ export async function editUserRoles(userId: string, roles: number[]): Promise<Us
 	}));
 }
 
-export async function getLogs(): Promise<Log[]> {
-	return handleRequest(api.get<ApiResponse<Log[]>>('/api/v1/logs'));
+export async function getLogs(limit: number = 1000): Promise<Log[]> {
+	const logs: Log[] = [];
+	let cursor: string | undefined;
+	do {
+		const page = await handleResponse(api.get<ApiResponse<Log[]>>('/api/v1/logs', {params: {limit, cursor}}));
+		logs.push(...page.data);
+		cursor = (page.meta?.next_cursor as string | null | undefined) ?? undefined;
+	} while (cursor);
+	return logs;
 }
 
 export async function createQueueMessage(channelId: string, title: string, eventTime: string): Promise<void> {
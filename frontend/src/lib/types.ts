@@ -15,6 +15,25 @@ export type Role = {
 	name: string;
 }
 
+export type CategoryTree = Category & {
+	position: number;
+	channels: Channel[];
+	roles_with_access: string[];
+}
+
+export type CategoryAccessMatrix = {
+	role_ids: string[];
+	category_ids: string[];
+	matrix: boolean[][];
+}
+
+export type GuildTree = {
+	categories: CategoryTree[];
+	channels_without_category: Channel[];
+	roles: Role[];
+	users: User[];
+}
+
 export type NameRequest = {
 	name: string;
 }
@@ -70,4 +89,9 @@ export interface RegistrationRequest {
 
 export interface StaffCategoryRequest {
     category_id?: string;
-}
\ No newline at end of file
+}
+
+export interface Bootstrap {
+    guild: GuildTree;
+    config: ServerConfig;
+}